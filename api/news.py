@@ -1,18 +1,50 @@
 """News API endpoints"""
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from typing import Optional
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from itertools import islice
+from typing import Iterator, Optional
 import logging
-from datetime import datetime
 
-from models.news import NewsResponse, NewsArticle
+import orjson
+
+from models.news import NewsResponse, NewsArticle, NewsArticleRecord
 from core.cache import get_news_cache
+from core.clock import now_iso
 from core.config import settings
+from core.scheduler import get_scheduler
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/news", tags=["news"])
 
 
+# Articles encoded per streamed chunk; StreamingResponse pulls each chunk of a
+# sync iterator through the threadpool, so one chunk per article is too chatty
+_STREAM_BATCH = 100
+
+
+def _stream_articles(articles: Iterator[NewsArticleRecord]) -> Iterator[bytes]:
+    """Stream a NewsResponse-shaped JSON document, _STREAM_BATCH articles per chunk"""
+    dumps = orjson.dumps
+    head = b'{"articles":['
+    total = 0
+    while True:
+        batch = list(islice(articles, _STREAM_BATCH))
+        if not batch:
+            break
+        yield head + b','.join([dumps(article.to_dict()) for article in batch])
+        head = b','
+        total += len(batch)
+    # Close the array and splice the pagination fields into the same object
+    yield (b'' if total else head) + b'],' + dumps({
+        "total": total,
+        "page": 1,
+        "page_size": total,
+        "has_next": False,
+        "has_prev": False
+    })[1:]
+
+
 @router.get("/", response_model=NewsResponse)
 async def get_news(
     page: int = 1,
@@ -26,7 +58,9 @@ async def get_news(
         cache = get_news_cache()
         
         if all:
-            page_size = 10000
+            # Stream instead of building one giant NewsResponse
+            articles = cache.iter_news(category=category, search=search)
+            return StreamingResponse(_stream_articles(articles), media_type="application/json")
         
         result = cache.get_news(
             page=page,
@@ -35,9 +69,6 @@ async def get_news(
             search=search
         )
         
-        if all:
-            result.page_size = result.total
-        
         return result
     except Exception as e:
         logger.error(f"Get news failed: {e}")
@@ -49,13 +80,12 @@ async def get_article(article_id: str):
     """Get single article by ID"""
     try:
         cache = get_news_cache()
-        result = cache.get_news(page=1, page_size=10000)
+        article = cache.get_by_id(article_id)
         
-        for article in result.articles:
-            if article.id == article_id:
-                return article
+        if not article:
+            raise HTTPException(status_code=404, detail="Article not found")
         
-        raise HTTPException(status_code=404, detail="Article not found")
+        return NewsArticle.model_validate(article)
     except HTTPException:
         raise
     except Exception as e:
@@ -64,39 +94,21 @@ async def get_article(article_id: str):
 
 
 @router.post("/crawl")
-async def crawl_news(background_tasks: BackgroundTasks, max_pages: Optional[int] = None):
+async def crawl_news(max_pages: Optional[int] = None):
     """Manually trigger news crawling"""
     try:
-        from services.cto51_crawler import CTO51Crawler
-        from models.news import NewsArticle
-        
-        def crawl_task():
-            logger.info("Starting crawl task...")
-            crawler = CTO51Crawler(min_article_id=settings.min_article_id)
-            cache = get_news_cache()
-            
-            def batch_callback(articles):
-                try:
-                    news_articles = [NewsArticle(**article) for article in articles]
-                    cache.append_to_cache(news_articles)
-                    logger.info(f"Batch saved: {len(news_articles)} articles")
-                except Exception as e:
-                    logger.error(f"Batch save failed: {e}")
-            
-            articles = crawler.crawl_all_pages(
-                max_pages=max_pages or settings.max_pages,
-                batch_callback=batch_callback,
-                batch_size=5
-            )
-            
-            logger.info(f"Crawl task completed: {len(articles)} articles")
+        scheduler = get_scheduler()
         
-        background_tasks.add_task(crawl_task)
+        if not scheduler.submit_crawl("Manual Crawl", max_pages=max_pages):
+            return {
+                "message": "Crawl already in progress",
+                "timestamp": now_iso()
+            }
         
         return {
             "message": "Crawl task started",
             "max_pages": max_pages or settings.max_pages,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "note": "Crawling in background, check cache status later"
         }
     except Exception as e:
@@ -118,7 +130,7 @@ async def get_status():
                 "identifier": "51CTO",
                 "category": "技术文章"
             },
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "endpoints": {
                 "all_news": "/api/news/",
                 "news_detail": "/api/news/{article_id}",
@@ -133,31 +145,20 @@ async def get_status():
 
 
 @router.post("/cache/refresh")
-async def refresh_cache(background_tasks: BackgroundTasks):
+async def refresh_cache():
     """Manually refresh cache"""
     try:
-        from services.cto51_crawler import CTO51Crawler
-        from models.news import NewsArticle
+        scheduler = get_scheduler()
         
-        def refresh_task():
-            logger.info("Starting cache refresh...")
-            crawler = CTO51Crawler(min_article_id=settings.min_article_id)
-            cache = get_news_cache()
-            
-            articles = crawler.crawl_all_pages(
-                max_pages=settings.max_pages,
-                batch_size=5
-            )
-            
-            news_articles = [NewsArticle(**article) for article in articles]
-            cache.update_cache(news_articles)
-            logger.info(f"Cache refreshed: {len(news_articles)} articles")
-        
-        background_tasks.add_task(refresh_task)
+        if not scheduler.submit_crawl("Cache Refresh", replace_cache=True):
+            return {
+                "message": "Crawl already in progress",
+                "timestamp": now_iso()
+            }
         
         return {
             "message": "Cache refresh started",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
     except Exception as e:
         logger.error(f"Refresh cache failed: {e}")
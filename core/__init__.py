@@ -1,8 +1,9 @@
 """Core modules"""
 from .config import settings
+from .clock import now_iso, start_clock, stop_clock
 from .cache import get_news_cache, init_cache
-from .logging_config import setup_logging
-from .scheduler import get_scheduler, start_scheduler, stop_scheduler
+from .logging_config import setup_logging, stop_logging
+from .scheduler import get_scheduler, start_scheduler, stop_scheduler, get_crawler
 
-__all__ = ['settings', 'get_news_cache', 'init_cache', 'setup_logging', 
-           'get_scheduler', 'start_scheduler', 'stop_scheduler']
+__all__ = ['settings', 'now_iso', 'start_clock', 'stop_clock', 'get_news_cache', 'init_cache', 'setup_logging', 'stop_logging',
+           'get_scheduler', 'start_scheduler', 'stop_scheduler', 'get_crawler']
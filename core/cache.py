@@ -1,13 +1,28 @@
 """Cache management"""
+import bisect
 import logging
 import threading
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from operator import attrgetter, itemgetter
+from typing import List, Optional, Dict, Any, Iterator, Set, Tuple
 from datetime import datetime
 from enum import Enum
-from models.news import NewsArticle, NewsResponse
+from .clock import now_iso
+from models.news import NewsArticle, NewsArticleRecord, NewsResponse
 
 logger = logging.getLogger(__name__)
 
+# Indexes are kept in ascending date order; readers walk them from the end.
+# Same-date articles are stored in reverse arrival order, so readers get them
+# in the order they were crawled (as a stable newest-first sort would)
+_sort_key = attrgetter('date_epoch')
+
+# Number of built NewsResponse pages kept between cache updates; larger pages
+# are built per request, so the LRU holds at most this many articles per entry
+_RESPONSE_CACHE_SIZE = 256
+_MAX_CACHED_PAGE_SIZE = 100
+
 
 class ServiceStatus(str, Enum):
     """Service status"""
@@ -16,15 +31,33 @@ class ServiceStatus(str, Enum):
     ERROR = "error"
 
 
+@dataclass(frozen=True)
+class _Snapshot:
+    """Immutable view of cached articles, swapped atomically on write"""
+    by_date: Tuple[NewsArticleRecord, ...] = ()
+    by_category: Dict[str, Tuple[NewsArticleRecord, ...]] = field(default_factory=dict)
+    by_id: Dict[str, NewsArticleRecord] = field(default_factory=dict)
+    version: int = 0
+
+
 class NewsCache:
     """News cache manager"""
     
     def __init__(self):
-        self._cache: List[NewsArticle] = []
-        self._cache_lock = threading.RLock()
+        # Readers take a reference to the current snapshot without locking;
+        # writers serialize on _write_lock and publish a new snapshot.
+        self._snapshot = _Snapshot()
+        self._write_lock = threading.Lock()
+        self._seen_urls: Set[str] = set()  # writer-side dedup, guarded by _write_lock
+        self._version = 0
+        # LRU of built responses; keys embed the snapshot version
+        self._responses: "OrderedDict[tuple, NewsResponse]" = OrderedDict()
+        self._responses_lock = threading.Lock()
+        self._cache_lock = threading.Lock()  # guards status fields
         self._status = ServiceStatus.PREPARING
         self._last_update = None
         self._error_message = None
+        self._bad_date_logged = False
         
     def get_status(self) -> Dict[str, Any]:
         """Get cache status"""
@@ -32,93 +65,235 @@ class NewsCache:
             return {
                 "status": self._status.value,
                 "last_update": self._last_update,
-                "cache_count": len(self._cache),
+                "cache_count": len(self._snapshot.by_date),
                 "error_message": self._error_message
             }
     
     def set_status(self, status: ServiceStatus, error_message: Optional[str] = None):
         """Set cache status"""
         with self._cache_lock:
-            self._status = status
-            self._error_message = error_message
-            logger.info(f"Cache status updated: {status.value}")
+            self._set_status_locked(status, error_message)
+    
+    def _set_status_locked(self, status: ServiceStatus, error_message: Optional[str] = None):
+        """Set cache status (caller holds _cache_lock)"""
+        self._status = status
+        self._error_message = error_message
+        logger.info(f"Cache status updated: {status.value}")
     
     def get_news(self, page: int = 1, page_size: int = 20,
                  category: Optional[str] = None,
                  search: Optional[str] = None) -> NewsResponse:
         """Get news with pagination and filtering"""
-        with self._cache_lock:
-            if self._status == ServiceStatus.ERROR:
-                raise Exception(f"Service error: {self._error_message}")
-            
-            # Filter data
-            filtered_news = self._cache.copy()
-            
-            # Category filter
-            if category:
-                filtered_news = [news for news in filtered_news if news.category == category]
-            
-            # Search filter
-            if search:
-                search_lower = search.lower()
-                filtered_news = [
-                    news for news in filtered_news
-                    if search_lower in news.title.lower() or
-                       (news.summary and search_lower in news.summary.lower())
-                ]
-            
-            # Sort by date (newest first)
-            try:
-                filtered_news.sort(key=lambda x: x.date, reverse=True)
-            except:
-                pass
-            
-            # Pagination
-            total = len(filtered_news)
-            start = (page - 1) * page_size
-            end = start + page_size
-            paginated_news = filtered_news[start:end]
-            
-            return NewsResponse(
-                articles=paginated_news,
-                total=total,
-                page=page,
-                page_size=page_size,
-                has_next=end < total,
-                has_prev=page > 1
-            )
+        if self._status == ServiceStatus.ERROR:
+            raise Exception(f"Service error: {self._error_message}")
+        
+        snapshot = self._snapshot
+        if page_size > _MAX_CACHED_PAGE_SIZE:
+            return self._build_response(snapshot, page, page_size, category, search)
+        key = (snapshot.version, page, page_size, category, search)
+        
+        with self._responses_lock:
+            response = self._responses.get(key)
+            if response is not None:
+                self._responses.move_to_end(key)
+                return response
+        
+        response = self._build_response(snapshot, page, page_size, category, search)
+        
+        with self._responses_lock:
+            self._responses[key] = response
+            if len(self._responses) > _RESPONSE_CACHE_SIZE:
+                self._responses.popitem(last=False)
+        
+        return response
+    
+    def iter_news(self, category: Optional[str] = None,
+                  search: Optional[str] = None) -> Iterator[NewsArticleRecord]:
+        """Iterate all matching articles, newest first, without pagination"""
+        if self._status == ServiceStatus.ERROR:
+            raise Exception(f"Service error: {self._error_message}")
+        
+        source = self._select_index(self._snapshot, category)
+        if search:
+            return self._search_filter(source, search)
+        return reversed(source)
+    
+    @staticmethod
+    def _select_index(snapshot: _Snapshot, category: Optional[str]) -> Tuple[NewsArticleRecord, ...]:
+        """Pick the date-sorted index to read from"""
+        # Category filter is a direct index lookup
+        if category:
+            return snapshot.by_category.get(category, ())
+        return snapshot.by_date
+    
+    @staticmethod
+    def _search_filter(source: Tuple[NewsArticleRecord, ...], search: str) -> Iterator[NewsArticleRecord]:
+        """Walk an index newest first, yielding articles matching search"""
+        # Bind the search term and str.__contains__ as locals for the hot loop
+        contains = str.__contains__
+        search_lower = search.lower()
+        return (
+            news for news in reversed(source)
+            if contains(news.title_lower, search_lower) or
+               (news.summary_lower is not None and contains(news.summary_lower, search_lower))
+        )
+    
+    @staticmethod
+    def _build_response(snapshot: _Snapshot, page: int, page_size: int,
+                        category: Optional[str],
+                        search: Optional[str]) -> NewsResponse:
+        """Build a page of results from a snapshot"""
+        source = NewsCache._select_index(snapshot, category)
+        
+        start = (page - 1) * page_size
+        end = start + page_size
+        
+        # Search filter (walk newest first, no re-sort needed); only the
+        # requested page is materialized, the rest is just counted
+        if search:
+            total = 0
+            paginated_news = []
+            for news in NewsCache._search_filter(source, search):
+                if start <= total < end:
+                    paginated_news.append(news)
+                total += 1
+        else:
+            # Pagination straight off the sorted index (newest first)
+            total = len(source)
+            lo = max(total - end, 0)
+            hi = max(total - start, 0)
+            paginated_news = list(reversed(source[lo:hi]))
+        
+        return NewsResponse(
+            articles=paginated_news,
+            total=total,
+            page=page,
+            page_size=page_size,
+            has_next=end < total,
+            has_prev=page > 1
+        )
+    
+    def get_by_id(self, article_id: str) -> Optional[NewsArticleRecord]:
+        """Get single article by ID"""
+        return self._snapshot.by_id.get(article_id)
+    
+    def _date_epoch(self, date: str) -> float:
+        """Parse an article date for sorting; unparseable dates sort last"""
+        try:
+            return datetime.fromisoformat(date).timestamp()
+        except ValueError:
+            if not self._bad_date_logged:
+                self._bad_date_logged = True
+                logger.warning(f"Unparseable article date {date!r}, sorting it last")
+            return 0.0
+    
+    def _make_record(self, article: NewsArticle) -> NewsArticleRecord:
+        """Convert an article to a cache record, precomputing search/sort fields"""
+        return NewsArticleRecord.from_article(article, self._date_epoch(article.date))
+    
+    def _make_raw_record(self, article: Dict[str, Any]) -> NewsArticleRecord:
+        """Convert a trusted crawler dict to a cache record"""
+        return NewsArticleRecord.from_dict(article, self._date_epoch(article['date']))
+    
+    @staticmethod
+    def _build_snapshot(articles: List[NewsArticleRecord], version: int = 0) -> _Snapshot:
+        """Build a snapshot from date-sorted articles"""
+        by_category: Dict[str, List[NewsArticleRecord]] = {}
+        for article in articles:
+            by_category.setdefault(article.category, []).append(article)
+        return _Snapshot(
+            by_date=tuple(articles),
+            by_category={key: tuple(value) for key, value in by_category.items()},
+            by_id={article.id: article for article in articles if article.id},
+            version=version
+        )
     
     def update_cache(self, news_data: List[NewsArticle]):
         """Update cache data"""
-        with self._cache_lock:
-            try:
-                self.set_status(ServiceStatus.PREPARING)
-                self._cache = news_data
-                self._last_update = datetime.now().isoformat()
-                self.set_status(ServiceStatus.READY)
-                logger.info(f"Cache updated successfully, {len(news_data)} articles")
-            except Exception as e:
-                error_msg = f"Cache update failed: {str(e)}"
-                self.set_status(ServiceStatus.ERROR, error_msg)
-                logger.error(error_msg)
-                raise
+        try:
+            # Build the replacement snapshot without blocking other writers
+            articles = sorted(
+                (self._make_record(article) for article in news_data),
+                key=_sort_key, reverse=True
+            )
+            articles.reverse()
+            snapshot = self._build_snapshot(articles)
+            seen_urls = {article.url for article in articles}
+        except Exception as e:
+            error_msg = f"Cache update failed: {str(e)}"
+            self.set_status(ServiceStatus.ERROR, error_msg)
+            logger.error(error_msg)
+            raise
+        
+        with self._write_lock:
+            self._version += 1
+            self._snapshot = replace(snapshot, version=self._version)
+            self._seen_urls = seen_urls
+            with self._cache_lock:
+                self._last_update = now_iso()
+                if self._status != ServiceStatus.READY:
+                    self._set_status_locked(ServiceStatus.READY)
+        logger.info(f"Cache updated successfully, {len(news_data)} articles")
     
     def append_to_cache(self, new_articles: List[NewsArticle]):
         """Append new articles to cache"""
-        with self._cache_lock:
+        self._append(new_articles, attrgetter('url'), self._make_record)
+    
+    def append_raw(self, articles: List[Dict[str, Any]]):
+        """Append crawler-produced article dicts, skipping Pydantic validation
+        
+        Only for the trusted crawler path; other callers should go through
+        append_to_cache.
+        """
+        self._append(articles, itemgetter('url'), self._make_raw_record)
+    
+    def _append(self, new_articles, url_of, make_record):
+        """Dedup new articles by URL and merge them into a new snapshot"""
+        with self._write_lock:
             try:
-                existing_urls = {article.url for article in self._cache}
-                unique_articles = [
-                    article for article in new_articles
-                    if article.url not in existing_urls
-                ]
+                snapshot = self._snapshot
+                seen_urls = self._seen_urls
+                unique_articles = []
+                for article in new_articles:
+                    # Build first, so a failed record doesn't leave its URL marked
+                    # seen; one bad (unvalidated) dict doesn't drop the batch
+                    try:
+                        url = url_of(article)
+                        if url in seen_urls:
+                            continue
+                        record = make_record(article)
+                    except Exception as e:
+                        logger.warning(f"Skipping malformed article: {e!r}")
+                        continue
+                    unique_articles.append(record)
+                    seen_urls.add(url)
                 
                 if unique_articles:
-                    self._cache.extend(unique_articles)
-                    self._last_update = datetime.now().isoformat()
+                    by_date = list(snapshot.by_date)
+                    by_category = dict(snapshot.by_category)
+                    by_id = dict(snapshot.by_id)
+                    touched: Dict[str, List[NewsArticleRecord]] = {}
+                    for article in unique_articles:
+                        bisect.insort_left(by_date, article, key=_sort_key)
+                        if article.id:
+                            by_id[article.id] = article
+                        if article.category not in touched:
+                            touched[article.category] = list(by_category.get(article.category, ()))
+                        bisect.insort_left(touched[article.category], article, key=_sort_key)
+                    for key, value in touched.items():
+                        by_category[key] = tuple(value)
                     
-                    if len(self._cache) > 0 and self._status == ServiceStatus.PREPARING:
-                        self.set_status(ServiceStatus.READY)
+                    self._version += 1
+                    self._snapshot = _Snapshot(
+                        by_date=tuple(by_date),
+                        by_category=by_category,
+                        by_id=by_id,
+                        version=self._version
+                    )
+                    with self._cache_lock:
+                        self._last_update = now_iso()
+                        if self._status == ServiceStatus.PREPARING:
+                            self._set_status_locked(ServiceStatus.READY)
                     
                     logger.info(f"Appended {len(unique_articles)} new articles to cache")
             except Exception as e:
@@ -127,10 +302,13 @@ class NewsCache:
     
     def clear_cache(self):
         """Clear cache"""
-        with self._cache_lock:
-            self._cache.clear()
-            self._last_update = None
-            self.set_status(ServiceStatus.PREPARING)
+        with self._write_lock:
+            self._version += 1
+            self._snapshot = _Snapshot(version=self._version)
+            self._seen_urls = set()
+            with self._cache_lock:
+                self._last_update = None
+                self._set_status_locked(ServiceStatus.PREPARING)
             logger.info("Cache cleared")
 
 
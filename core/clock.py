@@ -0,0 +1,56 @@
+"""Coarse wall-clock timestamp, refreshed by a background tick"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_TICK_SECONDS = 1.0
+
+_NOW_ISO = datetime.now().isoformat()
+_clock_task: Optional[asyncio.Task] = None
+
+
+def now_iso() -> str:
+    """Current time as an ISO string, at most one tick stale
+    
+    Without a running clock task (scripts, standalone crawler runs, tests)
+    the time is read directly instead of serving a frozen value.
+    """
+    if _clock_task is None or _clock_task.done():
+        return datetime.now().isoformat()
+    return _NOW_ISO
+
+
+def _refresh():
+    global _NOW_ISO
+    _NOW_ISO = datetime.now().isoformat()
+
+
+async def _run_clock():
+    """Refresh the cached timestamp once per tick"""
+    while True:
+        _refresh()
+        await asyncio.sleep(_TICK_SECONDS)
+
+
+def start_clock():
+    """Start the clock tick on the running event loop
+    
+    The timestamp is refreshed here too, since the first tick only runs once
+    the caller yields and the import-time value could be served until then.
+    """
+    global _clock_task
+    if _clock_task is None:
+        _refresh()
+        _clock_task = asyncio.get_running_loop().create_task(_run_clock())
+        logger.info("Clock started")
+
+
+def stop_clock():
+    """Stop the clock tick"""
+    global _clock_task
+    if _clock_task is not None:
+        _clock_task.cancel()
+        _clock_task = None
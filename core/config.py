@@ -1,6 +1,6 @@
 """Configuration settings"""
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -19,8 +19,15 @@ class Settings(BaseSettings):
     
     # Crawler
     min_article_id: int = 33500  # 主要控制：爬取到此 ID 为止
-    crawler_delay: float = 2.0
+    crawler_delay: float = 2.0  # 相邻两篇文章开始抓取的最小间隔（秒），并发时同样生效
+    crawler_max_concurrency: int = 3  # 同时抓取的文章页数
+    crawler_cdp_url: Optional[str] = None  # 连接已有浏览器（如 http://localhost:9222）而不是自行启动
+    crawler_remote_debugging_port: Optional[int] = None  # 为自行启动的浏览器开放 CDP 端口
+    crawler_stealth: bool = False  # 模拟真人：慢速滚动、阅读停顿、翻页等待（遇到反爬时开启）
+    crawler_near_dup: bool = True  # 丢弃与近期文章内容近似重复的文章（SimHash）
+    crawler_near_dup_distance: int = 3  # SimHash 汉明距离阈值，越小越严格
     max_pages: int = 999  # 备用限制：最大页数（通常不会达到）
+    data_file: str = "data/51cto_articles.jsonl"  # JSON Lines，每行一篇文章
     
     # Cache
     enable_cache: bool = True
@@ -1,25 +1,68 @@
 """Logging configuration"""
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
+from typing import Optional
 from .config import settings
 
+# Background listener that does the file/stdout I/O, and the root logger's
+# handler feeding it
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
 
 def setup_logging():
     """Setup logging configuration"""
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+    
     # Create logs directory
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
     
-    # Configure logging
-    logging.basicConfig(
-        level=getattr(logging, settings.log_level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(settings.log_file, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(settings.log_file, encoding='utf-8')
+    stream_handler = logging.StreamHandler(sys.stdout)
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+    
+    # Callers only enqueue records; a listener thread writes them out
+    log_queue: queue.Queue = queue.Queue(-1)
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
     )
+    _listener.start()
+    atexit.register(stop_logging)
+    
+    # Configure logging. QueueHandler.prepare() still merges the message args
+    # and any traceback on the calling thread; the listener's handlers only add
+    # the line layout and do the writes
+    root_logger = logging.getLogger()
+    root_logger.setLevel(getattr(logging, settings.log_level.upper()))
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    root_logger.addHandler(_queue_handler)
     
     logger = logging.getLogger(__name__)
     logger.info("Logging configured successfully")
+
+
+def stop_logging():
+    """Flush queued log records and stop the listener thread
+    
+    The file/stdout handlers go back on the root logger, so records logged
+    afterwards (e.g. by crawler threads still shutting down) are still written.
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        # Swap handlers before draining, so no record lands in a dead queue
+        root_logger = logging.getLogger()
+        for handler in _listener.handlers:
+            root_logger.addHandler(handler)
+        root_logger.removeHandler(_queue_handler)
+        _listener.stop()
+        _listener = None
+        _queue_handler = None
@@ -4,9 +4,12 @@ import asyncio
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Optional
 
 from .cache import get_news_cache, ServiceStatus
 from .config import settings
+from .storage import iter_articles, migrate_legacy_json
+from models.news import ARTICLE_LIST_ADAPTER
 
 logger = logging.getLogger(__name__)
 
@@ -15,36 +18,72 @@ class TaskScheduler:
     """Task scheduler for auto crawling"""
     
     def __init__(self):
-        self.thread_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="CrawlerWorker")
+        # Crawl runs and file writes get separate pools: submit_crawl lets only
+        # one crawl run at a time, and the single write worker keeps the data
+        # file output serialized
+        self.fetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Fetch")
+        self.write_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Write")
         self._initial_crawl_done = False
+        self._crawl_in_progress = threading.Event()
+        self._submit_lock = threading.Lock()
     
-    def _run_crawler_in_thread(self, task_name: str):
+    @property
+    def crawl_in_progress(self) -> bool:
+        """Whether a crawl is currently running or queued"""
+        return self._crawl_in_progress.is_set()
+    
+    def submit_crawl(self, task_name: str, max_pages: Optional[int] = None,
+                     replace_cache: bool = False) -> bool:
+        """Submit a crawl to the background thread, unless one is already running
+        
+        Returns False when the request was coalesced into a running crawl.
+        """
+        with self._submit_lock:
+            if self._crawl_in_progress.is_set():
+                logger.info(f"⏭️ {task_name} skipped: crawl already in progress")
+                return False
+            self._crawl_in_progress.set()
+        
+        try:
+            self.fetch_pool.submit(
+                self._run_crawler_in_thread,
+                task_name,
+                max_pages or settings.max_pages,
+                replace_cache
+            )
+        except Exception:
+            self._crawl_in_progress.clear()
+            raise
+        return True
+    
+    def _run_crawler_in_thread(self, task_name: str, max_pages: int, replace_cache: bool = False):
         """Run crawler in background thread"""
         try:
             logger.info(f"🚀 Starting {task_name}...")
             
-            from services.cto51_crawler import CTO51Crawler
-            from models.news import NewsArticle
-            
             cache = get_news_cache()
-            crawler = CTO51Crawler(min_article_id=settings.min_article_id)
+            crawler = get_crawler()
             
             # Batch callback to save data incrementally
             def batch_callback(articles):
                 try:
-                    news_articles = [NewsArticle(**article) for article in articles]
-                    cache.append_to_cache(news_articles)
-                    logger.info(f"📝 [{task_name}] Saved {len(news_articles)} articles to cache and file")
+                    # Crawler output has a known shape, so skip validation
+                    cache.append_raw(articles)
+                    logger.info(f"📝 [{task_name}] Saved {len(articles)} articles to cache and file")
                 except Exception as e:
                     logger.error(f"❌ [{task_name}] Batch save failed: {e}")
             
-            # Start crawling
+            # Start crawling (a full refresh swaps the cache once at the end)
             articles = crawler.crawl_all_pages(
-                max_pages=settings.max_pages,
-                batch_callback=batch_callback,
-                batch_size=5
+                max_pages=max_pages,
+                batch_callback=None if replace_cache else batch_callback,
+                batch_size=5,
+                write_pool=self.write_pool
             )
             
+            if replace_cache:
+                cache.update_cache(ARTICLE_LIST_ADAPTER.validate_python(articles))
+            
             logger.info(f"✅ {task_name} completed: {len(articles)} articles")
             logger.info(f"💾 All data saved to: {crawler.data_file}")
             
@@ -56,10 +95,11 @@ class TaskScheduler:
             logger.info(f"💾 Data has been saved incrementally during crawling")
             
         except Exception as e:
-            logger.error(f"❌ {task_name} failed: {e}")
+            logger.exception(f"❌ {task_name} failed: {e}")
             logger.info(f"💾 Data saved incrementally before error")
-            import traceback
-            traceback.print_exc()
+        
+        finally:
+            self._crawl_in_progress.clear()
     
     async def initial_cache_load(self):
         """Initial cache load on startup"""
@@ -70,19 +110,17 @@ class TaskScheduler:
             
             # First, try to load existing data from file
             cache = get_news_cache()
-            data_file = "data/51cto_articles.json"
+            data_file = settings.data_file
             
             try:
                 import os
-                import json
+                migrate_legacy_json(data_file)
                 if os.path.exists(data_file):
                     logger.info(f"📂 Loading existing data from {data_file}...")
-                    with open(data_file, 'r', encoding='utf-8') as f:
-                        existing_articles = json.load(f)
+                    existing_articles = list(iter_articles(data_file))
                     
                     if existing_articles:
-                        from models.news import NewsArticle
-                        news_articles = [NewsArticle(**article) for article in existing_articles]
+                        news_articles = ARTICLE_LIST_ADAPTER.validate_python(existing_articles)
                         cache.update_cache(news_articles)
                         logger.info(f"✅ Loaded {len(news_articles)} articles from file")
                         logger.info(f"📊 Cache is ready with existing data")
@@ -94,10 +132,7 @@ class TaskScheduler:
                 logger.warning(f"⚠️ Failed to load existing data: {e}")
             
             # Then submit crawler task to background thread
-            future = self.thread_pool.submit(
-                self._run_crawler_in_thread,
-                "Initial Crawl"
-            )
+            self.submit_crawl("Initial Crawl")
             
             logger.info("✅ Initial crawl task submitted to background thread")
             logger.info("📊 Server is ready to accept requests")
@@ -113,7 +148,10 @@ class TaskScheduler:
         """Shutdown scheduler"""
         try:
             logger.info("Shutting down scheduler...")
-            self.thread_pool.shutdown(wait=False)
+            self.fetch_pool.shutdown(wait=False)
+            # Drain queued writes so crawled articles reach the data file; a crawl
+            # still running afterwards writes synchronously
+            self.write_pool.shutdown(wait=True)
             logger.info("Scheduler shutdown complete")
         except Exception as e:
             logger.error(f"Scheduler shutdown error: {e}")
@@ -122,6 +160,30 @@ class TaskScheduler:
 # Global scheduler instance
 _scheduler: TaskScheduler = None
 
+# Shared crawler instance (keeps its URL history warm between runs)
+_crawler = None
+_crawler_lock = threading.Lock()
+
+
+def get_crawler():
+    """Get shared crawler instance"""
+    global _crawler
+    with _crawler_lock:
+        if _crawler is None:
+            from services.cto51_crawler import CTO51Crawler
+            _crawler = CTO51Crawler(
+                min_article_id=settings.min_article_id,
+                data_file=settings.data_file,
+                max_concurrency=settings.crawler_max_concurrency,
+                cdp_url=settings.crawler_cdp_url,
+                remote_debugging_port=settings.crawler_remote_debugging_port,
+                stealth=settings.crawler_stealth,
+                fetch_interval=settings.crawler_delay,
+                near_dup_distance=(settings.crawler_near_dup_distance
+                                   if settings.crawler_near_dup else None)
+            )
+        return _crawler
+
 
 def get_scheduler() -> TaskScheduler:
     """Get scheduler instance"""
@@ -0,0 +1,126 @@
+"""Article data file helpers (JSON Lines, one article per line)"""
+import logging
+import os
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+def _dump_lines(articles: List[Dict]) -> bytes:
+    """Serialize articles as JSON Lines (orjson writes UTF-8 without escaping)"""
+    dumps, option = orjson.dumps, orjson.OPT_APPEND_NEWLINE
+    return b''.join([dumps(article, option=option) for article in articles])
+
+
+def migrate_legacy_json(path: str):
+    """Convert the old single-array .json data file to JSON Lines at path
+    
+    Runs only when path does not exist yet and the legacy file does.
+    """
+    legacy_path = os.path.splitext(path)[0] + ".json"
+    if os.path.exists(path) or legacy_path == path or not os.path.exists(legacy_path):
+        return
+    
+    with open(legacy_path, 'rb') as f:
+        articles = orjson.loads(f.read())
+    
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_dump_lines(articles))
+    os.replace(tmp_path, path)
+    logger.info(f"📦 Migrated {len(articles)} articles from {legacy_path} to {path}")
+
+
+def iter_articles(path: str) -> Iterator[Dict]:
+    """Stream articles from a JSON Lines data file
+    
+    A truncated trailing line (e.g. from a crash mid-write) is skipped.
+    """
+    with open(path, 'rb') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError:
+                logger.warning(f"⚠️ Skipping malformed line {line_no} in {path}")
+
+
+_URL_KEY = b'"url":"'
+_FINGERPRINT_KEY = b'"fingerprint":"'
+_NULL_FINGERPRINT_TAIL = b'"fingerprint":null}'
+
+
+def _scan_history_line(line: bytes) -> Optional[Tuple[str, Optional[str]]]:
+    """Slice url and fingerprint out of an orjson-written line without parsing it
+    
+    Returns None when the line doesn't have the expected compact shape, which
+    includes a line cut short before its closing fingerprint field.
+    """
+    # The fingerprint is the last field, after the content blocks
+    if line.endswith(_NULL_FINGERPRINT_TAIL):
+        fingerprint = None
+    else:
+        start = line.rfind(_FINGERPRINT_KEY)
+        if start < 0:
+            return None
+        start += len(_FINGERPRINT_KEY)
+        end = line.find(b'"', start)
+        if end < 0 or line[end + 1:] != b'}':
+            return None
+        fingerprint = line[start:end].decode()
+    
+    start = line.find(_URL_KEY)
+    if start < 0:
+        return None
+    start += len(_URL_KEY)
+    end = line.find(b'"', start)
+    if end < 0 or b'\\' in line[start:end]:
+        return None
+    return line[start:end].decode(), fingerprint
+
+
+def iter_history(path: str) -> Iterator[Tuple[Optional[str], Optional[str]]]:
+    """Stream (url, fingerprint) pairs from a JSON Lines data file
+    
+    Lines written by append_articles are sliced directly, so no article dicts
+    are built; anything else falls back to a full parse.
+    """
+    with open(path, 'rb') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            fields = _scan_history_line(line)
+            if fields is not None:
+                yield fields
+                continue
+            try:
+                article = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                logger.warning(f"⚠️ Skipping malformed line {line_no} in {path}")
+                continue
+            yield article.get('url'), article.get('fingerprint')
+
+
+def append_articles(path: str, articles: List[Dict]):
+    """Append articles to a JSON Lines data file and fsync it"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Terminate a truncated last line so it does not swallow the next record
+    needs_newline = False
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+        with open(path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) != b'\n'
+    
+    with open(path, 'ab') as f:
+        if needs_newline:
+            f.write(b'\n')
+        f.write(_dump_lines(articles))
+        f.flush()
+        os.fsync(f.fileno())
@@ -2,11 +2,13 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+import asyncio
 import logging
 import time
 
 from core.config import settings
-from core.logging_config import setup_logging
+from core.clock import start_clock, stop_clock
+from core.logging_config import setup_logging, stop_logging
 from core.cache import init_cache, get_news_cache
 from core.scheduler import get_scheduler, start_scheduler, stop_scheduler
 from api import news_router
@@ -36,9 +38,10 @@ app.add_middleware(
 # Request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    start_time = time.time()
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
     response = await call_next(request)
-    process_time = time.time() - start_time
+    process_time = loop.time() - start_time
     
     logger.info(
         f"{request.method} {request.url.path} - "
@@ -100,6 +103,9 @@ async def health_check():
 async def startup_event():
     logger.info("Application starting...")
     
+    # Coarse timestamp used by status endpoints and the cache
+    start_clock()
+    
     # Initialize cache
     try:
         init_cache()
@@ -142,7 +148,10 @@ async def shutdown_event():
     except Exception as e:
         logger.error(f"Scheduler stop failed: {e}")
     
+    stop_clock()
+    
     logger.info("Application shutdown complete")
+    stop_logging()
 
 
 if __name__ == "__main__":
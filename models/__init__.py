@@ -1,4 +1,6 @@
 """Data models for 51CTO Backend"""
-from .news import NewsArticle, NewsContentBlock, NewsResponse, ContentType
+from .news import (NewsArticle, NewsArticleRecord, NewsContentBlock, NewsResponse,
+                   ContentType, ARTICLE_LIST_ADAPTER)
 
-__all__ = ['NewsArticle', 'NewsContentBlock', 'NewsResponse', 'ContentType']
+__all__ = ['NewsArticle', 'NewsArticleRecord', 'NewsContentBlock', 'NewsResponse',
+           'ContentType', 'ARTICLE_LIST_ADAPTER']
@@ -1,6 +1,7 @@
 """News data models"""
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
 from enum import Enum
 
@@ -13,6 +14,9 @@ class ContentType(str, Enum):
     VIDEO = "video"
 
 
+_CONTENT_TYPES = frozenset(content_type.value for content_type in ContentType)
+
+
 class NewsContentBlock(BaseModel):
     """News content block"""
     type: ContentType
@@ -22,6 +26,9 @@ class NewsContentBlock(BaseModel):
 
 class NewsArticle(BaseModel):
     """News article model"""
+    # Lets responses be built directly from cached NewsArticleRecord objects
+    model_config = ConfigDict(from_attributes=True)
+    
     id: Optional[str] = None
     title: str
     date: str
@@ -34,6 +41,84 @@ class NewsArticle(BaseModel):
     updated_at: Optional[datetime] = None
 
 
+@dataclass(slots=True, frozen=True)
+class NewsArticleRecord:
+    """Compact immutable article as stored in the cache
+    
+    Mirrors NewsArticle's fields (content blocks kept as plain dicts) plus
+    precomputed search/sort helpers, which are not part of the API output.
+    """
+    title: str
+    date: str
+    url: str
+    content: List[Dict[str, Any]]
+    id: Optional[str] = None
+    category: Optional[str] = None
+    summary: Optional[str] = None
+    source: Optional[str] = None
+    created_at: Optional[Union[datetime, str]] = None
+    updated_at: Optional[Union[datetime, str]] = None
+    title_lower: str = ""
+    summary_lower: Optional[str] = None
+    date_epoch: float = 0.0
+    
+    @classmethod
+    def from_article(cls, article: NewsArticle, date_epoch: float = 0.0) -> "NewsArticleRecord":
+        """Build a record from a validated article"""
+        return cls(
+            title=article.title,
+            date=article.date,
+            url=article.url,
+            content=[block.model_dump() for block in article.content],
+            id=article.id,
+            category=article.category,
+            summary=article.summary,
+            source=article.source,
+            created_at=article.created_at,
+            updated_at=article.updated_at,
+            title_lower=article.title.lower(),
+            summary_lower=article.summary.lower() if article.summary else None,
+            date_epoch=date_epoch
+        )
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], date_epoch: float = 0.0) -> "NewsArticleRecord":
+        """Build a record from a crawler-produced dict, without validation
+        
+        Only for trusted input that already has NewsArticle's shape; content
+        blocks of unknown type are dropped and extra block keys are ignored.
+        """
+        summary = data.get('summary')
+        # Drop the crawler-side fingerprint (stored on disk, not part of the
+        # API) and give content blocks NewsContentBlock's exact shape
+        data = {key: value for key, value in data.items() if key != 'fingerprint'}
+        data['content'] = [
+            {"type": block['type'], "value": block['value'], "language": block.get('language')}
+            for block in data['content'] if block.get('type') in _CONTENT_TYPES
+        ]
+        return cls(
+            **data,
+            title_lower=data['title'].lower(),
+            summary_lower=summary.lower() if summary else None,
+            date_epoch=date_epoch
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Public fields as plain data, ready for orjson"""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "date": self.date,
+            "url": self.url,
+            "content": self.content,
+            "category": self.category,
+            "summary": self.summary,
+            "source": self.source,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
+        }
+
+
 class NewsResponse(BaseModel):
     """News list response"""
     articles: List[NewsArticle]
@@ -42,3 +127,7 @@ class NewsResponse(BaseModel):
     page_size: int
     has_next: bool = Field(False, description="Has next page")
     has_prev: bool = Field(False, description="Has previous page")
+
+
+# Validates a whole batch of article dicts in one call
+ARTICLE_LIST_ADAPTER = TypeAdapter(List[NewsArticle])
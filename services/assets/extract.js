@@ -0,0 +1,228 @@
+// Content extraction helpers for 51CTO pages, installed once per browser
+// context as an init script (see CTO51Crawler.setup_browser).
+//
+//   __extractArticle()  author, publish date (YYYY-MM-DD) and content blocks
+//                       of the current article, in one round-trip
+//   __extractBlocks(el) content blocks under el
+//   __listArticles()    link, title and numeric id of each list page item
+//   __humanScroll()     the whole stealth scroll loop for a list page
+(() => {
+    const CODE_LANGUAGES = new Set([
+        'python', 'javascript', 'java', 'cpp', 'c++', 'csharp', 'c#', 'php', 'ruby', 'go',
+        'rust', 'swift', 'kotlin', 'typescript', 'sql', 'bash', 'shell', 'html', 'css',
+        'json', 'xml', 'yaml'
+    ]);
+    const TEXT_CONTAINERS = new Set(['P', 'H1', 'H2', 'H3', 'H4', 'H5', 'H6']);
+    const SKIPPED_TAGS = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT']);
+    const IMAGE_FILENAME = /^[\w\-]+\.(png|jpg|jpeg|gif|svg|webp)$/i;
+
+    // Publish date formats: YYYY-MM-DD (also . / 年月) and DD-MM-YYYY
+    const DATE_YMD = /(\d{4})[.\-\/年](\d{1,2})[.\-\/月](\d{1,2})/;
+    const DATE_DMY = /(\d{1,2})[.\-\/](\d{1,2})[.\-\/](\d{4})/;
+    // English month-name dates, e.g. "Mar 5, 2024"; only these go to Date,
+    // which otherwise reads things like "阅读 1234" as a year
+    const MONTH_NAME = /\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b/i;
+    const YEAR = /\b(\d{4})\b/;
+    const normDate = (s) => {
+        if (!s) return null;
+        const m = s.match(DATE_YMD) || s.match(DATE_DMY);
+        const pad = (n) => String(+n).padStart(2, '0');
+        if (!m) {
+            const year = s.match(YEAR);
+            if (!year || !MONTH_NAME.test(s) || +year[1] < 1990 || +year[1] > new Date().getFullYear()) {
+                return null;
+            }
+            const d = new Date(s);
+            return isNaN(d) ? null : `${d.getFullYear()}-${pad(d.getMonth() + 1)}-${pad(d.getDate())}`;
+        }
+        const [, a, b, c] = m;
+        return +a > 1900 ? `${a}-${pad(b)}-${pad(c)}` : `${c}-${pad(b)}-${pad(a)}`;
+    };
+
+    // Language named in a class list, memoized: code blocks repeat the same few.
+    // Exact tokens first ("language-go", "brush:python;toolbar:false"), then
+    // the name anywhere in the list ("language-python3", "prism-python")
+    const CLASS_PREFIX = /^(language-|lang-|brush-?)/;
+    const LANGUAGE_ANYWHERE = /(python|javascript|java|cpp|c\+\+|csharp|c#|php|ruby|go|rust|swift|kotlin|typescript|sql|bash|shell|html|css|json|xml|yaml)/i;
+    const classLanguages = new Map();
+    const classLanguage = (classNames) => {
+        let language = classLanguages.get(classNames);
+        if (language === undefined) {
+            language = '';
+            for (const cls of classNames.split(/[\s;:]+/)) {
+                const token = cls.replace(CLASS_PREFIX, '').toLowerCase();
+                if (CODE_LANGUAGES.has(token)) {
+                    language = token;
+                    break;
+                }
+            }
+            if (!language) {
+                const m = classNames.match(LANGUAGE_ANYWHERE);
+                language = m ? m[1].toLowerCase() : '';
+            }
+            classLanguages.set(classNames, language);
+        }
+        return language;
+    };
+
+    window.__extractBlocks = (element) => {
+        let blocks = [];
+
+        function getCodeLanguage(node) {
+            const classNames = typeof node.className === 'string' ? node.className : '';
+            const language = classLanguage(classNames);
+            if (language) {
+                return language;
+            }
+
+            if (node.nodeName === 'PRE') {
+                const codeElem = node.querySelector('code');
+                if (codeElem) {
+                    return getCodeLanguage(codeElem);
+                }
+            }
+
+            return '';
+        }
+
+        function getCodeText(node) {
+            const clone = node.cloneNode(true);
+            const lineNumbers = clone.querySelectorAll('.pre-numbering, .line-numbers, .line-number, ul.pre-numbering');
+            lineNumbers.forEach(elem => elem.remove());
+            return clone.textContent.trim();
+        }
+
+        function pushText(text) {
+            text = text.trim();
+            if (text && text.length > 10 && !IMAGE_FILENAME.test(text)) {
+                blocks.push({type: 'text', value: text});
+            }
+        }
+
+        function pushCode(node) {
+            const codeText = getCodeText(node);
+            if (codeText) {
+                blocks.push({
+                    type: 'code',
+                    value: codeText,
+                    language: getCodeLanguage(node)
+                });
+            }
+        }
+
+        // Text of the innermost open P/H* container, or null outside one.
+        // Inline images/code flush it, so the walk never rescans a subtree.
+        let pending = null;
+
+        function flushPending() {
+            if (pending !== null) {
+                pushText(pending);
+                pending = '';
+            }
+        }
+
+        function processNode(node) {
+            if (node.nodeType === Node.TEXT_NODE) {
+                if (pending !== null) {
+                    pending += node.textContent;
+                } else {
+                    pushText(node.textContent);
+                }
+                return;
+            }
+            if (node.nodeType !== Node.ELEMENT_NODE) return;
+
+            const tagName = node.nodeName;
+            if (SKIPPED_TAGS.has(tagName)) return;
+
+            if (tagName === 'IMG') {
+                const src = node.src || node.getAttribute('data-src') || node.getAttribute('data-original') || '';
+                if (src && src.startsWith('http')) {
+                    flushPending();
+                    blocks.push({type: 'image', value: src});
+                }
+                return;
+            }
+
+            // <code> inside <pre> is never reached: the <pre> is emitted whole
+            if (tagName === 'PRE' || tagName === 'CODE') {
+                flushPending();
+                pushCode(node);
+                return;
+            }
+
+            if (TEXT_CONTAINERS.has(tagName) && pending === null) {
+                pending = '';
+                for (const child of node.childNodes) {
+                    processNode(child);
+                }
+                pushText(pending);
+                pending = null;
+                return;
+            }
+
+            for (const child of node.childNodes) {
+                processNode(child);
+            }
+        }
+
+        processNode(element);
+        return blocks;
+    };
+
+    window.__extractArticle = () => {
+        const firstText = (selectors) => {
+            for (const selector of selectors) {
+                const elem = document.querySelector(selector);
+                const text = elem && elem.textContent.trim();
+                if (text) return text;
+            }
+            return null;
+        };
+        const root = document.querySelector('.posts-content');
+        const blocks = root ? window.__extractBlocks(root) : [];
+        return {
+            author: firstText(['.name', '.author', '.post-author']),
+            publish_time: normDate(firstText(['time', '.publish-time', '.post-time'])),
+            has_container: !!root,
+            blocks: blocks
+        };
+    };
+
+    // Slow, uneven scroll to the bottom with occasional look-backs
+    window.__humanScroll = async () => {
+        const rand = (min, max) => min + Math.random() * (max - min);
+        const pause = (min, max) => new Promise(r => setTimeout(r, rand(min, max)));
+        const maxScrolls = Math.floor(rand(8, 16));
+        let height = document.body.scrollHeight;
+        let position = 0;
+        for (let i = 0; i < maxScrolls && position < height; i++) {
+            position += Math.floor(rand(200, 801));
+            window.scrollTo({top: position, behavior: 'smooth'});
+            await pause(500, 2000);
+            if (Math.random() < 0.2) {
+                position = Math.max(0, position - Math.floor(rand(50, 201)));
+                window.scrollTo({top: position, behavior: 'smooth'});
+                await pause(300, 800);
+            }
+            height = Math.max(height, document.body.scrollHeight);
+        }
+    };
+
+    window.__listArticles = () => Array.from(
+        document.querySelectorAll('ul.infinite-list > li')
+    ).map((li, i) => {
+        const link = li.querySelector("a[href*='posts']");
+        if (!link) return null;
+        // Raw attribute, not link.href, so URLs match the ones already stored
+        const url = link.getAttribute('href');
+        const match = url.match(/\/posts\/(\d+)\s*$/);
+        const titleElem = li.querySelector('h3.title-h3');
+        return {
+            idx: i + 1,
+            url: url,
+            title: titleElem ? titleElem.textContent.trim() : '',
+            article_id: match ? parseInt(match[1], 10) : null
+        };
+    }).filter(Boolean);
+})();
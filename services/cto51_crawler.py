@@ -1,89 +1,496 @@
 """51CTO Crawler Service - Playwright Version"""
-from playwright.sync_api import sync_playwright, Page, Browser
-import time
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Locator
+import asyncio
 import random
+import time
 import hashlib
 import logging
-import json
 import os
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional, Callable
+from functools import lru_cache
+from typing import AsyncIterator, List, Dict, Optional, Callable, Set, Tuple
+from urllib.parse import urlsplit
+
+import orjson
+
 from core.proxy_pool import proxy_pool
+from core.storage import append_articles, iter_history, migrate_legacy_json
 
 logger = logging.getLogger(__name__)
 
+# Content extraction script, installed once per context as an init script
+# so each article only sends a short evaluate() call
+_EXTRACT_JS_PATH = os.path.join(os.path.dirname(__file__), 'assets', 'extract.js')
+
+# Log separators: _BANNER around pages and runs, _RULE between articles
+_BANNER = '=' * 60
+_RULE = '─' * 60
+
+# Container of the post list items on list pages
+_ARTICLE_LIST_SELECTOR = "ul.infinite-list"
+# href of the first post link in the list, to tell when click paging has
+# replaced the list
+_FIRST_LIST_LINK_JS = (
+    "() => { const a = document.querySelector('ul.infinite-list a[href*=\"posts\"]');"
+    " return a ? a.href : null; }"
+)
+
+# Paginate by opening /postlist?page=N; False falls back to clicking "下一页"
+USE_URL_PAGING = True
+
+# Batches allowed to wait on the writer before the crawl blocks
+_MAX_PENDING_WRITES = 8
+
+# Saved articles are buffered and written (and fsynced) together once this
+# many are waiting or this many seconds passed since the last write
+_FLUSH_ARTICLES = 32
+_FLUSH_INTERVAL = 60.0
+
+# A list page that doesn't load is re-opened this many times, waiting
+# _LIST_RETRY_DELAY seconds and doubling, before the crawl stops
+_LIST_RETRIES = 2
+_LIST_RETRY_DELAY = 5.0
+
+# Extra spacing between article fetches after failures: starts here, doubles
+# on each failed attempt up to the cap, halves on each success
+_BACKOFF_MIN = 1.0
+_BACKOFF_MAX = 30.0
+
+# Resource types aborted on every page; extraction only needs the DOM
+# (image URLs are read from src attributes, not the pixels)
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet", "websocket"})
+
+# Known slow third-party trackers
+_BLOCKED_DOMAINS = (
+    'googletagmanager.com',
+    'google-analytics.com',
+    'doubleclick.net',
+    'facebook.com',
+    'twitter.com',
+    'linkedin.com',
+    'hm.baidu.com',
+    'cnzz.com',
+)
+
+# Same policy as URL patterns for Network.setBlockedURLs, so Chromium drops
+# these in-process instead of asking _handle_route about every request.
+# Patterns can't see resource types, so assets go by file extension.
+_BLOCKED_EXTENSIONS = (
+    'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'ico', 'bmp',
+    'css', 'woff', 'woff2', 'ttf', 'otf', 'eot',
+    'mp4', 'webm', 'mp3', 'm3u8', 'flv',
+)
+_BLOCKED_URL_PATTERNS = [
+    pattern
+    for ext in _BLOCKED_EXTENSIONS
+    for pattern in (f"*.{ext}", f"*.{ext}?*")
+] + [f"*://*{domain}/*" for domain in _BLOCKED_DOMAINS]
+
+# First-party hosts whose documents, scripts and XHRs must always load
+_ALLOWED_HOSTS = ("ost.51cto.com",)
+
+
+# Post ids above this go to an overflow set instead of growing the bitmap
+_MAX_BITMAP_ID = 1 << 27
+
+
+class _IdBitmap:
+    """Set of non-negative post ids stored as one bit each
+    
+    Post ids are dense integers, so a bitmap is exact (no false positives)
+    and takes about one byte per eight ids instead of a PyObject per entry.
+    """
+    __slots__ = ('_bits', '_overflow', '_count')
+    
+    def __init__(self):
+        self._bits = bytearray()
+        self._overflow: Set[int] = set()
+        self._count = 0
+    
+    def add(self, post_id: int):
+        if post_id >= _MAX_BITMAP_ID:
+            self._overflow.add(post_id)
+            return
+        index, mask = post_id >> 3, 1 << (post_id & 7)
+        if index >= len(self._bits):
+            size = min(max(index + 1, 2 * len(self._bits)), _MAX_BITMAP_ID >> 3)
+            self._bits.extend(bytes(size - len(self._bits)))
+        if not self._bits[index] & mask:
+            self._bits[index] |= mask
+            self._count += 1
+    
+    def __contains__(self, post_id: int) -> bool:
+        if post_id >= _MAX_BITMAP_ID:
+            return post_id in self._overflow
+        index = post_id >> 3
+        return index < len(self._bits) and bool(self._bits[index] & (1 << (post_id & 7)))
+    
+    def __len__(self) -> int:
+        return self._count + len(self._overflow)
+
+
+# Near-duplicate detection: articles whose content SimHash is within
+# near_dup_distance bits (default _SIMHASH_DISTANCE) of one of the last
+# _SIMHASH_WINDOW fingerprints are dropped. Text shorter than
+# _SIMHASH_MIN_CHARS isn't fingerprinted, since short or templated posts
+# (release notes, weekly digests) collide too easily
+_SIMHASH_DISTANCE = 3
+_SIMHASH_WINDOW = 4096
+_SIMHASH_MIN_CHARS = 200
+_BIT_LANES = tuple(
+    sum(1 << (32 * i) for i in range(8) if byte >> i & 1) for byte in range(256)
+)
+
+
+def _content_simhash(blocks: List[Dict]) -> Optional[int]:
+    """64-bit Charikar SimHash over character 3-gram shingles of text blocks
+    
+    Character shingles work for Chinese text, which has no word breaks.
+    Returns None when there is too little text to fingerprint.
+    """
+    text = ' '.join(block['value'] for block in blocks if block.get('type') == 'text')
+    if len(text) < _SIMHASH_MIN_CHARS:
+        return None
+    shingles = {text[i:i + 3] for i in range(len(text) - 2)}
+    if not shingles:
+        return None
+    # Per-bit vote counts, one accumulator per digest byte; _BIT_LANES turns
+    # a byte into eight 32-bit lanes so one addition counts all of its bits
+    lanes = [0] * 8
+    for shingle in shingles:
+        digest = hashlib.blake2b(shingle.encode(), digest_size=8).digest()
+        for k, byte in enumerate(digest):
+            lanes[k] += _BIT_LANES[byte]
+    half = len(shingles) / 2
+    fingerprint = 0
+    for k, lane in enumerate(lanes):
+        for i in range(8):
+            if (lane >> (32 * i)) & 0xFFFFFFFF > half:
+                fingerprint |= 1 << (8 * k + i)
+    return fingerprint
+
+
+def _post_id(url: str) -> Optional[int]:
+    """Numeric id from a .../posts/<id> URL, or None
+    
+    Accepts the same ids as __listArticles in extract.js (ASCII digits, then
+    optional whitespace), so both sides key the crawl history the same way.
+    """
+    tail = url.rsplit('/posts/', 1)
+    if len(tail) == 2:
+        digits = tail[1].rstrip()
+        if digits.isascii() and digits.isdigit():
+            return int(digits)
+    return None
+
+
+# Summaries are the first text block cut to this many characters
+_SUMMARY_LENGTH = 200
+
+
+def _summarize(blocks: List[Dict]) -> str:
+    """Summary from the first non-empty text block
+    
+    Cut here rather than in the page: Python slices by code point, while a JS
+    slice can split a surrogate pair and leave JSON that orjson rejects.
+    """
+    for block in blocks:
+        if block.get('type') == 'text' and block.get('value'):
+            text = block['value']
+            return text[:_SUMMARY_LENGTH] + '...' if len(text) > _SUMMARY_LENGTH else text
+    return ''
+
+
+@lru_cache(maxsize=4096)
+def _article_id(url: str) -> str:
+    """Stable article id derived from its URL (memoized across retries/runs)"""
+    return hashlib.md5(url.encode()).digest()[:8].hex()
+
+
+def _url_key(url: str) -> bytes:
+    """Compact history key for URLs without a numeric post id"""
+    return hashlib.md5(url.encode()).digest()[:8]
+
 
 class CTO51Crawler:
     """51CTO Article Crawler using Playwright"""
     
-    def __init__(self, min_article_id: int = 33500, data_file: str = "data/51cto_articles.json"):
+    def __init__(self, min_article_id: int = 33500, data_file: str = "data/51cto_articles.jsonl",
+                 max_concurrency: int = 3, cdp_url: Optional[str] = None,
+                 remote_debugging_port: Optional[int] = None, stealth: bool = False,
+                 fetch_interval: float = 0.0,
+                 near_dup_distance: Optional[int] = _SIMHASH_DISTANCE):
         self.base_url = "https://ost.51cto.com/postlist"
         self.source = "51CTO"
         self.category = "技术文章"
         self.min_article_id = min_article_id
         self.data_file = data_file
-        self.scraped_urls = set()
+        # Near-duplicates dropped by the crawl, kept apart from the articles
+        self.skip_file = os.path.splitext(data_file)[0] + ".skipped.jsonl"
+        self.max_concurrency = max_concurrency  # article pages fetched at once
+        self.cdp_url = cdp_url  # connect to a shared browser instead of launching one
+        self.remote_debugging_port = remote_debugging_port  # expose our browser over CDP
+        self.stealth = stealth  # human-like scrolling and pauses; off = wait on page state only
+        self.fetch_interval = fetch_interval  # min seconds between article fetch starts
+        self.near_dup_distance = near_dup_distance  # SimHash bits; None keeps near-duplicates
+        self._next_fetch_at = 0.0  # event loop time the next article fetch may start
+        self._backoff = 0.0  # seconds added to fetch_interval while the site pushes back
+        self._page_num = 1  # current list page when paging by URL
+        # Crawl history: numeric post ids, plus full URLs for links without one
+        self.scraped_ids = _IdBitmap()
+        self.scraped_urls: Set[bytes] = set()  # _url_key of URLs without a post id
+        # Recent (content SimHash, url) pairs, for near-duplicate detection
+        self.fingerprints: "deque[Tuple[int, str]]" = deque(maxlen=_SIMHASH_WINDOW)
         self.playwright = None
         self.browser = None
+        self.context: Optional[BrowserContext] = None
         self.page = None
+        self.spare_page: Optional[Page] = None  # loads list page N+1 while page N is crawled
+        self._next_locator: Optional[Locator] = None  # "下一页" button, for click paging
+        self.page_pool: Optional["asyncio.Queue[Page]"] = None  # recycled article pages
+        
+        # Single-worker executor persisting the data file (see _save_data)
+        self._write_pool: Optional[Executor] = None
+        self._owns_write_pool = False
+        self._pending_writes: List[Future] = []
+        self._unflushed: List[Dict] = []  # saved articles not yet handed to the writer
+        self._unflushed_skipped: List[Dict] = []  # skip records not yet handed to the writer
+        self._last_flush = time.monotonic()
         
         # Load existing data
         self._load_existing_data()
     
+    @classmethod
+    def connect(cls, cdp_url: str, **kwargs) -> "CTO51Crawler":
+        """Create a crawler that drives an already running Chromium over CDP"""
+        return cls(cdp_url=cdp_url, **kwargs)
+    
+    def reset_state(self):
+        """Drop per-run browser handles so the instance can crawl again"""
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.page = None
+        self.spare_page = None
+        self._next_locator = None
+        self.page_pool = None
+        self._backoff = 0.0
+    
+    async def close_browser(self):
+        """Close the browser and stop Playwright, then drop the handles
+        
+        Failures are logged rather than raised, so teardown always completes.
+        The crawl's own context is closed first: over CDP, browser.close()
+        only disconnects and would leave its pages open in the shared browser.
+        """
+        if self.context:
+            try:
+                await self.context.close()
+            except Exception as e:
+                logger.warning("⚠️ Context close failed: %s", e)
+        
+        if self.browser:
+            try:
+                await self.browser.close()
+                logger.info("Browser closed")
+            except Exception as e:
+                logger.warning("⚠️ Browser close failed: %s", e)
+        
+        if self.playwright:
+            try:
+                await self.playwright.stop()
+                logger.info("Playwright stopped")
+            except Exception as e:
+                logger.warning("⚠️ Playwright stop failed: %s", e)
+        
+        self.reset_state()
+    
     def _load_existing_data(self):
         """Load existing crawled data from file"""
         try:
+            migrate_legacy_json(self.data_file)
             if os.path.exists(self.data_file):
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    existing_articles = json.load(f)
-                    self.scraped_urls = {article['url'] for article in existing_articles if article.get('url')}
-                    logger.info(f"✅ Loaded {len(existing_articles)} existing articles from {self.data_file}")
-                    logger.info(f"📋 {len(self.scraped_urls)} URLs in history")
+                # Stream the file; only post ids (or URLs) are kept in memory
+                count = 0
+                for url, fingerprint in iter_history(self.data_file):
+                    count += 1
+                    if url:
+                        self._mark_scraped(url)
+                    if fingerprint:
+                        self.fingerprints.append((int(fingerprint, 16), url or ''))
+                logger.info("✅ Loaded %d existing articles from %s", count, self.data_file)
             else:
-                logger.info(f"📝 No existing data file found, will create new one")
+                logger.info("📝 No existing data file found, will create new one")
+            if os.path.exists(self.skip_file):
+                # Dropped near-duplicates, so they aren't fetched again
+                count = 0
+                for url, _ in iter_history(self.skip_file):
+                    if url:
+                        count += 1
+                        self._mark_scraped(url)
+                logger.info("✅ Loaded %d skipped near-duplicates from %s", count, self.skip_file)
+            logger.info("📋 %d URLs in history", self.history_size)
         except Exception as e:
-            logger.warning(f"⚠️ Failed to load existing data: {e}")
+            logger.warning("⚠️ Failed to load existing data: %s", e)
+            self.scraped_ids = _IdBitmap()
             self.scraped_urls = set()
+            self.fingerprints.clear()
+    
+    @property
+    def history_size(self) -> int:
+        """Number of crawled articles remembered for dedup"""
+        return len(self.scraped_ids) + len(self.scraped_urls)
+    
+    def _is_scraped(self, url: str, article_id: Optional[int] = None) -> bool:
+        """Whether url was crawled before (article_id may be pre-parsed)"""
+        if article_id is None:
+            article_id = _post_id(url)
+        if article_id is not None:
+            return article_id in self.scraped_ids
+        return _url_key(url) in self.scraped_urls
+    
+    def _mark_scraped(self, url: str):
+        """Record url in the crawl history"""
+        article_id = _post_id(url)
+        if article_id is not None:
+            self.scraped_ids.add(article_id)
+        else:
+            self.scraped_urls.add(_url_key(url))
+    
+    def _near_duplicate_of(self, article: Dict) -> Optional[str]:
+        """URL of a recent article with matching content; records article if none"""
+        if self.near_dup_distance is None or not article.get('fingerprint'):
+            return None
+        fingerprint = int(article['fingerprint'], 16)
+        for seen, url in self.fingerprints:
+            if (fingerprint ^ seen).bit_count() <= self.near_dup_distance:
+                return url
+        self.fingerprints.append((fingerprint, article['url']))
+        return None
+    
+    def _start_writer(self, write_pool: Optional[Executor] = None):
+        """Route batch writes to write_pool, or to a private single-worker pool
+        
+        The pool must have exactly one worker so writes stay serialized.
+        """
+        if write_pool is None:
+            write_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="CrawlerWriter")
+            self._owns_write_pool = True
+        self._write_pool = write_pool
+        self._pending_writes = []
+        self._unflushed = []
+        self._unflushed_skipped = []
+        self._last_flush = time.monotonic()
+    
+    async def _stop_writer(self):
+        """Flush buffered articles, wait for queued batches and release the write pool"""
+        if self._write_pool is None:
+            return
+        await self._flush_data()
+        for future in self._pending_writes:
+            await asyncio.wrap_future(future)
+        self._pending_writes = []
+        if self._owns_write_pool:
+            self._write_pool.shutdown(wait=True)
+            self._owns_write_pool = False
+        self._write_pool = None
+    
+    async def _save_data(self, articles: List[Dict]):
+        """Buffer articles, flushing them to the writer in groups
+        
+        During a crawl several small batches share one append and fsync;
+        whatever is still buffered when it ends is flushed by _stop_writer.
+        Outside a crawl (no writer running) articles are written right away.
+        """
+        self._unflushed.extend(articles)
+        if (self._write_pool is None or len(self._unflushed) >= _FLUSH_ARTICLES or
+                time.monotonic() - self._last_flush >= _FLUSH_INTERVAL):
+            await self._flush_data()
+    
+    async def _flush_data(self):
+        """Queue buffered articles for the write pool
+        
+        Returns as soon as the batch is queued; only waits (without blocking
+        the event loop) when the writer falls behind, so batches are never
+        dropped.
+        """
+        articles, self._unflushed = self._unflushed, []
+        skipped, self._unflushed_skipped = self._unflushed_skipped, []
+        self._last_flush = time.monotonic()
+        if skipped:
+            if self._write_pool is None:
+                await asyncio.to_thread(self._write_skipped, skipped)
+            else:
+                await self._submit_write(self._write_skipped, skipped)
+        if not articles:
+            return
+        if self._write_pool is None:
+            await asyncio.to_thread(self._write_data, articles)
+            return
+        
+        await self._submit_write(self._write_data, articles)
     
-    def _save_data(self, articles: List[Dict]):
-        """Save articles to file"""
+    async def _submit_write(self, fn: Callable, *args):
+        """Queue fn(*args) on the write pool, waiting only when it falls behind"""
+        self._pending_writes = [f for f in self._pending_writes if not f.done()]
+        if len(self._pending_writes) >= _MAX_PENDING_WRITES:
+            await asyncio.wrap_future(self._pending_writes.pop(0))
         try:
-            os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-            
-            # Load existing data
-            existing_articles = []
-            if os.path.exists(self.data_file):
-                try:
-                    with open(self.data_file, 'r', encoding='utf-8') as f:
-                        existing_articles = json.load(f)
-                except:
-                    pass
-            
-            # Merge with new articles (avoid duplicates)
-            existing_urls = {article['url'] for article in existing_articles if article.get('url')}
-            new_articles = [article for article in articles if article['url'] not in existing_urls]
-            
-            if new_articles:
-                all_articles = existing_articles + new_articles
-                with open(self.data_file, 'w', encoding='utf-8') as f:
-                    json.dump(all_articles, f, ensure_ascii=False, indent=2)
-                logger.info(f"💾 Saved {len(new_articles)} new articles to {self.data_file}")
-                logger.info(f"📊 Total articles in file: {len(all_articles)}")
+            future = self._write_pool.submit(fn, *args)
+        except RuntimeError:
+            # The pool was shut down under us (e.g. scheduler shutdown); run it
+            # here rather than drop the batch
+            logger.warning("⚠️ Write pool is shut down, writing synchronously")
+            fn(*args)
+            return
+        self._pending_writes.append(future)
+    
+    def _write_data(self, articles: List[Dict]):
+        """Append articles to the data file
+        
+        Batches only contain URLs that were not in the history when crawled,
+        so no re-read of the file is needed to dedup.
+        """
+        try:
+            if articles:
+                append_articles(self.data_file, articles)
+                logger.info("💾 Saved %d new articles to %s", len(articles), self.data_file)
             else:
-                logger.info(f"📝 No new articles to save")
+                logger.info("📝 No new articles to save")
                 
         except Exception as e:
-            logger.error(f"❌ Failed to save data: {e}")
+            logger.error("❌ Failed to save data: %s", e)
     
-    def setup_browser(self):
-        """Setup Playwright browser with Linux server compatibility and proxy support"""
-        logger.info("Starting Chromium browser in headless mode...")
-        self.playwright = sync_playwright().start()
+    async def _save_skipped(self, article: Dict, duplicate_of: str):
+        """Record a dropped near-duplicate in the skip file
         
+        Written with the next batch of articles (right away outside a crawl),
+        so restarts don't fetch and drop it again.
+        """
+        self._unflushed_skipped.append({
+            "url": article['url'],
+            "duplicate_of": duplicate_of or None,
+            "fingerprint": article['fingerprint']
+        })
+        if self._write_pool is None:
+            await self._flush_data()
+    
+    def _write_skipped(self, records: List[Dict]):
+        """Append skip records to the skip file"""
+        try:
+            append_articles(self.skip_file, records)
+            logger.info("💾 Saved %d skipped near-duplicates to %s", len(records), self.skip_file)
+        except Exception as e:
+            logger.error("❌ Failed to save skipped near-duplicates: %s", e)
+    
+    async def _launch_browser(self) -> Browser:
+        """Launch a local headless Chromium"""
         # 获取代理配置
         proxy_config = proxy_pool.get_proxy()
         if proxy_config:
-            logger.info(f"🌐 使用代理: {proxy_config.get('server')}")
+            logger.info("🌐 使用代理: %s", proxy_config.get('server'))
         else:
             logger.info("🌐 不使用代理（直连）")
         
@@ -123,23 +530,49 @@ class CTO51Crawler:
                 '--enable-automation',
                 '--password-store=basic',
                 '--use-mock-keychain',
-                
-                # 内存优化
-                '--single-process',                          # 单进程模式（减少资源占用）
-                '--no-zygote',                              # 禁用 zygote 进程
             ],
             # 增加超时时间，适应服务器环境
             'timeout': 60000
         }
         
+        if self.max_concurrency == 1:
+            # 内存优化：顺序抓取时单进程即可
+            launch_options['args'] += [
+                '--single-process',                          # 单进程模式（减少资源占用）
+                '--no-zygote',                              # 禁用 zygote 进程
+            ]
+        else:
+            # 并发抓取：每个页面独立渲染进程才能并行，列表页 + 预取列表页 + 文章页，最多 8 个
+            launch_options['args'].append(
+                f'--renderer-process-limit={min(self.max_concurrency + 2, 8)}'
+            )
+        
         # 如果有代理，添加代理配置
         if proxy_config:
             launch_options['proxy'] = proxy_config
         
-        self.browser = self.playwright.chromium.launch(**launch_options)
+        # 可选：开放 CDP 端口，供其他爬虫进程通过 CTO51Crawler.connect() 共享本浏览器
+        if self.remote_debugging_port:
+            launch_options['args'].append(f'--remote-debugging-port={self.remote_debugging_port}')
+            logger.info("🔌 CDP endpoint on port %d", self.remote_debugging_port)
+        
+        return await self.playwright.chromium.launch(**launch_options)
+    
+    async def setup_browser(self):
+        """Setup Playwright browser with Linux server compatibility and proxy support"""
+        self.playwright = await async_playwright().start()
+        
+        if self.cdp_url:
+            logger.info("Connecting to shared Chromium over CDP: %s", self.cdp_url)
+            self.browser = await self.playwright.chromium.connect_over_cdp(self.cdp_url)
+        else:
+            logger.info("Starting Chromium browser in headless mode...")
+            self.browser = await self._launch_browser()
         
-        # Create context with anti-detection and realistic settings
-        context = self.browser.new_context(
+        # Create context with anti-detection and realistic settings. A shared
+        # CDP browser gets its own context too: close_browser() closes it with
+        # all its pages, routes and init scripts, leaving the browser clean
+        context = await self.browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
             # 添加更多真实浏览器特征
@@ -157,6 +590,7 @@ class CTO51Crawler:
         # 设置默认超时时间（Linux 服务器网络可能较慢）
         context.set_default_timeout(45000)
         context.set_default_navigation_timeout(45000)
+        self.context = context
         
         # 🔥 关键：设置严格的网络空闲超时，避免无限等待
         # 如果页面在 5 秒内没有网络活动，就认为加载完成
@@ -167,7 +601,7 @@ class CTO51Crawler:
             pass
         
         # Add anti-detection script
-        context.add_init_script("""
+        await context.add_init_script("""
             // 隐藏 webdriver 特征
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => undefined
@@ -196,306 +630,162 @@ class CTO51Crawler:
             );
         """)
         
-        self.page = context.new_page()
+        # 内容提取脚本只注入一次，之后每篇文章直接调用 window.__extractBlocks
+        await context.add_init_script(path=_EXTRACT_JS_PATH)
         
-        # 🔥 关键优化：阻止慢速资源，避免卡住
-        # 阻止字体、某些图片和视频，加快加载速度
-        def handle_route(route):
-            """处理网络请求，阻止不必要的资源"""
-            request = route.request
-            resource_type = request.resource_type
-            url = request.url
-            
-            # 阻止字体文件（通常很慢且不影响爬取）
-            if resource_type == "font":
-                route.abort()
-                return
-            
-            # 阻止视频和音频
-            if resource_type in ["media"]:
-                route.abort()
-                return
-            
-            # 阻止某些已知慢速的第三方资源
-            blocked_domains = [
-                'googletagmanager.com',
-                'google-analytics.com',
-                'doubleclick.net',
-                'facebook.com',
-                'twitter.com',
-                'linkedin.com',
-            ]
-            
-            if any(domain in url for domain in blocked_domains):
-                route.abort()
-                return
-            
-            # 其他请求正常处理，但设置超时
-            try:
-                route.continue_()
-            except:
-                route.abort()
+        self.page = await context.new_page()
+        list_pages = [self.page]
+        if USE_URL_PAGING:
+            self.spare_page = await context.new_page()
+            list_pages.append(self.spare_page)
         
-        # 注册路由处理器
-        try:
-            self.page.route("**/*", handle_route)
-            logger.info("✅ Resource blocking enabled (fonts, media, trackers)")
-        except Exception as e:
-            logger.warning(f"⚠️ Could not enable resource blocking: {e}")
+        # Pre-warm one article page per concurrent worker; pages are recycled
+        # across articles instead of being opened and closed each time
+        pages = [await context.new_page() for _ in range(self.max_concurrency)]
+        self.page_pool = asyncio.Queue()
+        for page in pages:
+            self.page_pool.put_nowait(page)
+        
+        # 🔥 关键优化：阻止慢速资源。优先用 CDP 屏蔽列表（浏览器内处理），
+        # 不支持时退回到 context 级别的 route 回调
+        blocked = [await self._block_urls(page) for page in [*list_pages, *pages]]
+        if all(blocked):
+            logger.info("✅ Resource blocking enabled via CDP (images, css, fonts, media, trackers)")
+        else:
+            try:
+                await context.route("**/*", self._handle_route)
+                logger.info("✅ Resource blocking enabled (images, css, fonts, media, trackers)")
+            except Exception as e:
+                logger.warning("⚠️ Could not enable resource blocking: %s", e)
         
         logger.info("✅ Chromium browser started successfully (Linux-compatible mode)")
         logger.info("   - Sandbox: disabled")
         logger.info("   - GPU: disabled")
         logger.info("   - Timeout: 45s")
         logger.info("   - Resource blocking: enabled")
+        logger.info("   - Article pages: %d", self.max_concurrency)
     
-    def _random_delay(self, min_sec: float = 2, max_sec: float = 5):
-        """Random delay - simulate human behavior"""
-        delay = random.uniform(min_sec, max_sec)
-        logger.debug(f"Waiting {delay:.2f} seconds...")
-        time.sleep(delay)
-    
-    def _human_like_scroll(self):
-        """Human-like scrolling - simulate real user behavior"""
+    async def _block_urls(self, page: Page) -> bool:
+        """Install _BLOCKED_URL_PATTERNS on page over CDP; False if unsupported"""
         try:
-            total_height = self.page.evaluate("document.body.scrollHeight")
-            current_position = 0
-            max_scrolls = random.randint(8, 15)  # 随机滚动次数
-            scroll_count = 0
-            
-            while current_position < total_height and scroll_count < max_scrolls:
-                # 随机滚动距离，模拟真人
-                scroll_distance = random.randint(200, 800)
-                current_position += scroll_distance
-                
-                # 使用平滑滚动
-                self.page.evaluate(f"window.scrollTo({{top: {current_position}, behavior: 'smooth'}})")
-                
-                # 随机停顿时间，模拟阅读
-                pause_time = random.uniform(0.5, 2.0)
-                time.sleep(pause_time)
-                
-                # 偶尔向上滚动一点（模拟回看）
-                if random.random() < 0.2:  # 20% 概率
-                    back_scroll = random.randint(50, 200)
-                    current_position = max(0, current_position - back_scroll)
-                    self.page.evaluate(f"window.scrollTo({{top: {current_position}, behavior: 'smooth'}})")
-                    time.sleep(random.uniform(0.3, 0.8))
-                
-                scroll_count += 1
-                
-                new_height = self.page.evaluate("document.body.scrollHeight")
-                if new_height > total_height:
-                    total_height = new_height
+            session = await self.context.new_cdp_session(page)
+            await session.send("Network.enable")
+            await session.send("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
+            return True
         except Exception as e:
-            logger.warning(f"Scroll error: {e}")
+            logger.debug("CDP URL blocking unavailable: %s", e)
+            return False
     
-    def _extract_content(self) -> List[Dict]:
-        """Extract article content"""
-        try:
-            content_container = self.page.query_selector(".posts-content")
-            if not content_container:
-                logger.warning("Content container not found")
-                return []
-        except:
-            logger.warning("Content container not found")
-            return []
-        
-        js_script = r"""
-(element) => {
-    let blocks = [];
-    let processedNodes = new Set();
-    
-    function getCodeLanguage(node) {
-        const classNames = node.className || '';
-        const langMatch = classNames.match(/(?:language-|lang-|brush:)?(python|javascript|java|cpp|c\+\+|csharp|c#|php|ruby|go|rust|swift|kotlin|typescript|sql|bash|shell|html|css|json|xml|yaml)/i);
-        if (langMatch) {
-            return langMatch[1].toLowerCase();
-        }
+    @staticmethod
+    async def _handle_route(route):
+        """处理网络请求，阻止不必要的资源"""
+        request = route.request
         
-        if (node.nodeName === 'PRE') {
-            const codeElem = node.querySelector('code');
-            if (codeElem) {
-                const codeClass = codeElem.className || '';
-                const codeLangMatch = codeClass.match(/(?:language-|lang-|brush:)?(python|javascript|java|cpp|c\+\+|csharp|c#|php|ruby|go|rust|swift|kotlin|typescript|sql|bash|shell|html|css|json|xml|yaml)/i);
-                if (codeLangMatch) {
-                    return codeLangMatch[1].toLowerCase();
-                }
-            }
-        }
+        # 图片、样式、字体、音视频：任何来源都不需要
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+            return
         
-        return '';
-    }
+        # 阻止某些已知慢速的第三方资源（站内请求不受影响）
+        host = urlsplit(request.url).hostname or ''
+        if not host.endswith(_ALLOWED_HOSTS) and any(domain in host for domain in _BLOCKED_DOMAINS):
+            await route.abort()
+            return
+        
+        # 其他请求正常处理
+        try:
+            await route.continue_()
+        except:
+            await route.abort()
     
-    function getCodeText(node) {
-        const clone = node.cloneNode(true);
-        const lineNumbers = clone.querySelectorAll('.pre-numbering, .line-numbers, .line-number, ul.pre-numbering');
-        lineNumbers.forEach(elem => elem.remove());
-        return clone.textContent.trim();
-    }
+    @staticmethod
+    async def _wait_for_idle(page: Page, timeout: int = 5000):
+        """Wait until the page's network goes quiet, at most timeout ms"""
+        try:
+            await page.wait_for_load_state('networkidle', timeout=timeout)
+        except Exception:
+            logger.debug("Network not idle yet, continuing")
     
-    function processNode(node) {
-        if (['SCRIPT', 'STYLE', 'NOSCRIPT'].includes(node.nodeName)) return;
-        if (processedNodes.has(node)) return;
-        
-        if (node.nodeType === Node.ELEMENT_NODE) {
-            const tagName = node.nodeName;
-            
-            if (tagName === 'IMG') {
-                const src = node.src || node.getAttribute('data-src') || node.getAttribute('data-original') || '';
-                if (src && src.startsWith('http')) {
-                    blocks.push({type: 'image', value: src});
-                }
-                return;
-            }
-            
-            if (tagName === 'PRE') {
-                processedNodes.add(node);
-                const codeText = getCodeText(node);
-                if (codeText) {
-                    const language = getCodeLanguage(node);
-                    blocks.push({
-                        type: 'code',
-                        value: codeText,
-                        language: language
-                    });
-                }
-                return;
-            }
-            
-            if (tagName === 'CODE') {
-                const parent = node.parentElement;
-                if (parent && parent.nodeName === 'PRE') {
-                    return;
-                }
-                processedNodes.add(node);
-                const codeText = getCodeText(node);
-                if (codeText) {
-                    const language = getCodeLanguage(node);
-                    blocks.push({
-                        type: 'code',
-                        value: codeText,
-                        language: language
-                    });
-                }
-                return;
-            }
-            
-            if (['P', 'H1', 'H2', 'H3', 'H4', 'H5', 'H6'].includes(tagName)) {
-                const images = node.querySelectorAll('img');
-                const codeBlocks = node.querySelectorAll('pre, code');
-                
-                if (images.length > 0 || codeBlocks.length > 0) {
-                    for (let child of node.childNodes) {
-                        processNode(child);
-                    }
-                    return;
-                }
-                
-                let text = node.textContent.trim();
-                if (text && text.length > 10 && !text.match(/^[\w\-]+\.(png|jpg|jpeg|gif|svg|webp)$/i)) {
-                    blocks.push({type: 'text', value: text});
-                }
-                return;
-            }
-            
-            if (tagName === 'DIV') {
-                const codeBlocks = node.querySelectorAll('pre, code');
-                if (codeBlocks.length > 0) {
-                    for (let child of node.childNodes) {
-                        processNode(child);
-                    }
-                    return;
-                }
-                
-                const images = node.querySelectorAll('img');
-                if (images.length > 0) {
-                    for (let child of node.childNodes) {
-                        processNode(child);
-                    }
-                    return;
-                }
-                
-                for (let child of node.childNodes) {
-                    processNode(child);
-                }
-                return;
-            }
-            
-            for (let child of node.childNodes) {
-                processNode(child);
-            }
-        }
+    async def _random_delay(self, min_sec: float = 2, max_sec: float = 5):
+        """Random delay - simulate human behavior"""
+        delay = random.uniform(min_sec, max_sec)
+        logger.debug("Waiting %.2f seconds...", delay)
+        await asyncio.sleep(delay)
+    
+    async def _load_all_items(self, page: Page, stable_rounds: int = 2, max_rounds: int = 20):
+        """Scroll to the bottom until the list item count stops growing"""
+        try:
+            prev = -1
+            stable = 0
+            for _ in range(max_rounds):
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                await asyncio.sleep(0.4)
+                count = await page.evaluate("document.querySelectorAll('ul.infinite-list > li').length")
+                stable = stable + 1 if count == prev else 0
+                if stable >= stable_rounds:
+                    break
+                prev = count
+        except Exception as e:
+            logger.warning("Scroll error: %s", e)
+    
+    async def _human_like_scroll(self, page: Page):
+        """Human-like scrolling - simulate real user behavior
         
-        if (node.nodeType === Node.TEXT_NODE) {
-            let text = node.textContent.trim();
-            if (text && text.length > 10 && !text.match(/^[\w\-]+\.(png|jpg|jpeg|gif|svg|webp)$/i)) {
-                blocks.push({type: 'text', value: text});
-            }
-        }
-    }
+        The whole scroll loop runs in the page (window.__humanScroll), so it
+        costs one evaluate() instead of one per step.
+        """
+        try:
+            await page.evaluate("() => window.__humanScroll()")
+        except Exception as e:
+            logger.warning("Scroll error: %s", e)
     
-    processNode(element);
-    return blocks;
-}
-"""
+    async def _extract_article(self, page: Page) -> Dict:
+        """Extract author, publish time and content blocks from page in one call"""
         try:
-            content_blocks = content_container.evaluate(js_script)
-            valid_blocks = []
-            for block in content_blocks:
-                if isinstance(block, dict) and 'type' in block and 'value' in block:
-                    if block['type'] in ['text', 'image', 'code']:
-                        valid_blocks.append(block)
-            return valid_blocks if valid_blocks else []
+            # One JSON string crosses the wire instead of a value tree that
+            # Playwright would rebuild object by object
+            data = orjson.loads(await page.evaluate("() => JSON.stringify(window.__extractArticle())"))
         except Exception as e:
-            logger.error(f"Content extraction failed: {e}")
+            logger.error("Content extraction failed: %s", e)
+            data = {'author': None, 'publish_time': None, 'has_container': True, 'blocks': []}
             try:
-                text = content_container.text_content().strip()
+                text = await page.evaluate(
+                    "() => { const root = document.querySelector('.posts-content');"
+                    " return root ? root.textContent.trim() : ''; }"
+                )
                 if text:
-                    return [{"type": "text", "value": text}]
+                    data['blocks'] = [{"type": "text", "value": text}]
             except:
                 pass
-            return []
+        
+        if not data.get('has_container'):
+            logger.warning("Content container not found")
+        
+        # Blocks only come from __extractBlocks (or the text fallback above),
+        # which emit text/image/code dicts, so no per-block check is needed
+        blocks = data.get('blocks') or []
+        return {
+            'author': data.get('author'),
+            'publish_time': data.get('publish_time'),
+            'content': blocks,
+            'summary': _summarize(blocks)
+        }
     
-    def _standardize_date(self, date_str: str) -> str:
-        """Standardize date format to YYYY-MM-DD"""
-        if not date_str:
-            return datetime.now().strftime('%Y-%m-%d')
-        try:
-            import re
-            patterns = [
-                r'(\d{4})[.\-\/年](\d{1,2})[.\-\/月](\d{1,2})',
-                r'(\d{1,2})[.\-\/](\d{1,2})[.\-\/](\d{4})',
-            ]
-            for pattern in patterns:
-                match = re.search(pattern, str(date_str))
-                if match:
-                    groups = match.groups()
-                    if len(groups) == 3:
-                        if int(groups[0]) > 1900:
-                            year, month, day = groups
-                        else:
-                            day, month, year = groups
-                        return f"{int(year):04d}-{int(month):02d}-{int(day):02d}"
-            logger.warning(f"Cannot parse date: {date_str}, using current date")
-            return datetime.now().strftime('%Y-%m-%d')
-        except Exception as e:
-            logger.error(f"Date standardization failed: {e}")
-            return datetime.now().strftime('%Y-%m-%d')
+    def _standardize_date(self, date_str: Optional[str]) -> str:
+        """Fill in today's date when none was parsed (normalized to YYYY-MM-DD in JS)"""
+        return date_str or datetime.now().strftime('%Y-%m-%d')
     
-    def _format_article(self, article_data: Dict) -> Dict:
-        """Format article to HongYiXun format"""
-        article_id = hashlib.md5(article_data['url'].encode()).hexdigest()[:16]
-        standardized_date = self._standardize_date(article_data.get('publish_time', ''))
+    def _format_article(self, article_data: Dict, now_iso: Optional[str] = None) -> Dict:
+        """Format article to HongYiXun format
         
-        summary = ""
-        if article_data.get('content'):
-            for block in article_data['content']:
-                if block.get('type') == 'text':
-                    text = block.get('value', '')
-                    if text:
-                        summary = text[:200] + ('...' if len(text) > 200 else '')
-                        break
+        now_iso stamps created_at/updated_at; callers formatting a batch pass
+        one shared value.
+        """
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
+        article_id = _article_id(article_data['url'])
+        standardized_date = self._standardize_date(article_data.get('publish_time', ''))
+        fingerprint = _content_simhash(article_data.get('content', []))
         
         return {
             "id": article_id,
@@ -504,14 +794,20 @@ class CTO51Crawler:
             "url": article_data['url'],
             "content": article_data.get('content', []),
             "category": self.category,
-            "summary": summary,
+            "summary": article_data.get('summary', ''),
             "source": self.source,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
+            "created_at": now_iso,
+            "updated_at": now_iso,
+            "fingerprint": None if fingerprint is None else f"{fingerprint:016x}"
         }
     
-    def _get_article_list(self) -> Dict:
-        """Get article list from current page"""
+    async def _get_article_list(self, page: Optional[Page] = None) -> Optional[Dict]:
+        """Get article list from the current list page (or the given one)
+        
+        Returns None when the list didn't load, so a slow page isn't mistaken
+        for an empty one (item_count 0, i.e. past the last page).
+        """
+        page = page or self.page
         article_elements = []
         old_articles_count = 0
         total_valid_articles = 0
@@ -520,81 +816,128 @@ class CTO51Crawler:
             # 等待文章列表加载（Linux 服务器使用更长超时）
             logger.info("Waiting for article list to load...")
             try:
-                self.page.wait_for_selector("ul.infinite-list", timeout=30000)
+                await page.wait_for_selector(_ARTICLE_LIST_SELECTOR, timeout=30000)
                 logger.info("✅ Article list found")
             except Exception as e:
-                logger.warning(f"⚠️ Article list selector timeout: {e}")
+                logger.warning("⚠️ Article list selector timeout: %s", e)
                 # 尝试等待任何文章链接
                 try:
-                    self.page.wait_for_selector("a[href*='posts']", timeout=20000)
+                    await page.wait_for_selector("a[href*='posts']", timeout=20000)
                     logger.info("✅ Article links found")
                 except:
                     logger.error("❌ No article elements found")
-                    return {'articles': [], 'all_old': False}
+                    return None
             
             # 滚动加载更多内容
-            self._human_like_scroll()
-            time.sleep(3)  # 等待动态内容加载
+            if self.stealth:
+                await self._human_like_scroll(page)
+                await self._wait_for_idle(page)  # 等待动态内容加载
+            else:
+                await self._load_all_items(page)
             
-            list_items = self.page.query_selector_all("ul.infinite-list > li")
-            logger.info(f"Found {len(list_items)} article items")
+            # One round-trip for every item's link, title and numeric id
+            list_items = await page.evaluate("() => window.__listArticles()")
+            logger.info("Found %d article items", len(list_items))
             
-            for idx, item in enumerate(list_items, 1):
-                try:
-                    link_elem = item.query_selector("a[href*='posts']")
-                    if not link_elem:
-                        continue
-                    
-                    url = link_elem.get_attribute('href')
-                    
-                    article_id = None
-                    try:
-                        article_id = int(url.split('/posts/')[-1])
-                    except:
-                        pass
-                    
-                    try:
-                        title_elem = item.query_selector("h3.title-h3")
-                        title = title_elem.text_content().strip() if title_elem else ""
-                    except:
-                        title = link_elem.text_content().strip().split('\n')[0]
-                    
-                    if not title:
-                        title = "无标题"
-                    
-                    if article_id and article_id <= self.min_article_id:
-                        logger.info(f"Skip old article: {title} (ID: {article_id})")
-                        old_articles_count += 1
-                        continue
-                    
-                    total_valid_articles += 1
-                    
-                    # Check if already crawled
-                    if url in self.scraped_urls:
-                        logger.info(f"[{idx}] ⏭️  Skip crawled: {title} (ID: {article_id})")
-                        continue
-                    
-                    article_elements.append({
-                        'url': url,
-                        'title': title,
-                        'article_id': article_id
-                    })
-                    logger.info(f"[{idx}] 📄 To crawl: {title} (ID: {article_id})")
-                except Exception as e:
-                    logger.warning(f"[{idx}] Parse failed: {e}")
+            for item in list_items:
+                idx = item['idx']
+                url = item['url']
+                article_id = item['article_id']
+                title = item['title'] or "无标题"
+                
+                if article_id and article_id <= self.min_article_id:
+                    logger.info("Skip old article: %s (ID: %s)", title, article_id)
+                    old_articles_count += 1
+                    continue
+                
+                total_valid_articles += 1
+                
+                # Check if already crawled
+                if self._is_scraped(url, article_id):
+                    logger.info("[%d] ⏭️  Skip crawled: %s (ID: %s)", idx, title, article_id)
                     continue
+                
+                article_elements.append({
+                    'url': url,
+                    'title': title,
+                    'article_id': article_id
+                })
+                logger.info("[%d] 📄 To crawl: %s (ID: %s)", idx, title, article_id)
             
-            logger.info(f"Got {len(article_elements)} new articles to crawl")
+            logger.info("Got %d new articles to crawl", len(article_elements))
             return {
                 'articles': article_elements,
-                'all_old': (total_valid_articles == 0 and old_articles_count > 0)
+                'all_old': (total_valid_articles == 0 and old_articles_count > 0),
+                'item_count': len(list_items)
             }
         except Exception as e:
-            logger.error(f"Get article list failed: {e}")
-            return {'articles': [], 'all_old': False}
+            logger.error("Get article list failed: %s", e)
+            return None
+    
+    async def _load_list_page(self, reload: bool = False) -> Optional[Dict]:
+        """Read the current list page, reloading it with backoff if it didn't load
+        
+        reload opens the page first (when the list page is still on an
+        earlier page). Returns None once the retries are used up.
+        """
+        result = None
+        for attempt in range(_LIST_RETRIES + 1):
+            if attempt:
+                delay = _LIST_RETRY_DELAY * 2 ** (attempt - 1)
+                logger.warning("⚠️ List page did not load, retrying in %.0fs (%d/%d)",
+                               delay, attempt, _LIST_RETRIES)
+                await asyncio.sleep(delay)
+            if (reload or attempt) and USE_URL_PAGING:
+                if not await self._goto_page(self._page_num):
+                    continue
+            result = await self._get_article_list()
+            if result is not None:
+                break
+        return result
+    
+    async def _throttle(self):
+        """Space article fetch starts at least fetch_interval seconds apart
+        
+        Keeps the crawl polite however many pages run concurrently; the gap
+        widens by the current backoff after failed fetches.
+        """
+        interval = self.fetch_interval + self._backoff
+        if interval <= 0:
+            return
+        now = asyncio.get_running_loop().time()
+        start_at = max(now, self._next_fetch_at)
+        self._next_fetch_at = start_at + interval
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+    
+    async def _retry_delay(self):
+        """Back off after a failed fetch attempt, then wait before retrying"""
+        self._backoff = min(max(self._backoff * 2, _BACKOFF_MIN), _BACKOFF_MAX)
+        await asyncio.sleep(self._backoff * random.uniform(0.8, 1.2))
     
-    def _crawl_single_article(self, article_info: Dict) -> Optional[Dict]:
-        """Crawl single article"""
+    def _relax_backoff(self):
+        """Halve the backoff after a successful fetch"""
+        self._backoff /= 2
+        if self._backoff < _BACKOFF_MIN:
+            self._backoff = 0.0
+    
+    async def _crawl_single_article(self, article_info: Dict, now_iso: Optional[str] = None) -> Optional[Dict]:
+        """Crawl single article on a page borrowed from the page pool"""
+        page = await self.page_pool.get()
+        try:
+            await self._throttle()
+            return await self._crawl_article_on_page(page, article_info, now_iso)
+        finally:
+            # Unload the article before handing the page to the next worker
+            try:
+                await page.goto('about:blank')
+            except Exception:
+                pass
+            self.page_pool.put_nowait(page)
+    
+    async def _crawl_article_on_page(self, page: Page, article_info: Dict,
+                                     now_iso: Optional[str] = None) -> Optional[Dict]:
+        """Crawl single article using page"""
         url = article_info['url']
         title = article_info['title']
         
@@ -603,7 +946,7 @@ class CTO51Crawler:
         for attempt in range(max_retries):
             try:
                 if attempt > 0:
-                    logger.warning(f"Retry attempt {attempt + 1}/{max_retries} for: {title}")
+                    logger.warning("Retry attempt %d/%d for: %s", attempt + 1, max_retries, title)
                     # 重试时更换代理
                     if proxy_pool.enabled:
                         proxy_pool.reset_counter()
@@ -617,358 +960,448 @@ class CTO51Crawler:
                     'content': []
                 }
                 
-                logger.info(f"📖 Opening article: {title}")
+                logger.info("📖 Opening article: %s", title)
                 
                 # 随机等待一下再打开文章，模拟思考时间
-                think_time = random.uniform(1, 3)
-                time.sleep(think_time)
-                
-                # Open in new page
-                new_page = self.page.context.new_page()
+                if self.stealth:
+                    await asyncio.sleep(random.uniform(1, 3))
                 
                 # Linux 服务器使用更宽松的加载策略
                 try:
-                    new_page.goto(url, wait_until='domcontentloaded', timeout=60000)
+                    await page.goto(url, wait_until='domcontentloaded', timeout=60000)
                     logger.info("✅ Article page loaded")
                 except Exception as e:
-                    logger.warning(f"⚠️ Page load failed: {e}")
+                    logger.warning("⚠️ Page load failed: %s", e)
                     try:
                         # 尝试更宽松的策略
-                        new_page.goto(url, wait_until='commit', timeout=60000)
+                        await page.goto(url, wait_until='commit', timeout=60000)
                         logger.info("✅ Article page loaded (commit)")
                     except Exception as e2:
-                        logger.error(f"❌ Page load completely failed: {e2}")
-                        new_page.close()
+                        logger.error("❌ Page load completely failed: %s", e2)
                         if attempt < max_retries - 1:
-                            self._random_delay(3, 5)
+                            await self._retry_delay()
                             continue
                         else:
                             return None
                 
                 # Wait for content with longer timeout
                 try:
-                    new_page.wait_for_selector(".posts-content", timeout=30000)
+                    await page.wait_for_selector(".posts-content", timeout=30000)
                     logger.info("✅ Article content loaded successfully")
                 except:
-                    logger.warning(f"⚠️ Content not loaded within 30 seconds")
+                    logger.warning("⚠️ Content not loaded within 30 seconds")
                     # 即使选择器未出现，也尝试继续（可能内容已加载但选择器不同）
-                    time.sleep(3)
+                    await asyncio.sleep(3)
                     # 检查页面是否有内容
                     try:
-                        body_text = new_page.evaluate("document.body.innerText")
+                        body_text = await page.evaluate("document.body.innerText")
                         if len(body_text) < 100:
                             logger.error("❌ Page content too short, likely failed")
-                            new_page.close()
                             if attempt < max_retries - 1:
-                                self._random_delay(3, 5)
+                                await self._retry_delay()
                                 continue
                             else:
                                 return None
                         else:
                             logger.info("✅ Page has content, continuing...")
                     except:
-                        new_page.close()
                         if attempt < max_retries - 1:
-                            self._random_delay(3, 5)
+                            await self._retry_delay()
                             continue
                         else:
                             return None
                 
                 # 模拟真人阅读：随机滚动
-                scroll_times = random.randint(2, 5)
-                for _ in range(scroll_times):
-                    scroll_pos = random.randint(300, 1000)
-                    new_page.evaluate(f"window.scrollBy({{top: {scroll_pos}, behavior: 'smooth'}})")
-                    time.sleep(random.uniform(0.8, 2.0))  # 模拟阅读时间
+                if self.stealth:
+                    for _ in range(random.randint(2, 5)):
+                        scroll_pos = random.randint(300, 1000)
+                        await page.evaluate(f"window.scrollBy({{top: {scroll_pos}, behavior: 'smooth'}})")
+                        await asyncio.sleep(random.uniform(0.8, 2.0))  # 模拟阅读时间
                 
-                # Extract author
-                try:
-                    for selector in [".name", ".author", ".post-author"]:
-                        try:
-                            author_elem = new_page.query_selector(selector)
-                            if author_elem:
-                                article_data['author'] = author_elem.text_content().strip()
-                                if article_data['author']:
-                                    break
-                        except:
-                            continue
-                except:
-                    pass
-                
-                # Extract publish time
-                try:
-                    for selector in ["time", ".publish-time", ".post-time"]:
-                        try:
-                            time_elem = new_page.query_selector(selector)
-                            if time_elem:
-                                article_data['publish_time'] = time_elem.text_content().strip()
-                                if article_data['publish_time']:
-                                    break
-                        except:
-                            continue
-                except:
-                    pass
-                
-                # Extract content
+                # Extract author, publish time and content in one round-trip
                 logger.info("Extracting article content...")
-                content_container = new_page.query_selector(".posts-content")
-                if content_container:
-                    article_data['content'] = self._extract_content()
+                article_data.update(await self._extract_article(page))
                 
                 # Verify content
                 if not article_data['content'] or len(article_data['content']) == 0:
-                    logger.warning(f"⚠️ Extracted content is empty")
-                    new_page.close()
+                    logger.warning("⚠️ Extracted content is empty")
                     if attempt < max_retries - 1:
-                        self._random_delay(2, 3)
+                        await self._retry_delay()
                         continue
                     else:
                         return None
                 
-                logger.info(f"✅ Successfully crawled article!")
-                logger.info(f"  - Author: {article_data['author'] or 'Unknown'}")
-                logger.info(f"  - Publish time: {article_data['publish_time'] or 'Unknown'}")
-                logger.info(f"  - Content blocks: {len(article_data['content'])}")
+                logger.info("✅ Successfully crawled article!")
+                logger.info("  - Author: %s", article_data['author'] or 'Unknown')
+                logger.info("  - Publish time: %s", article_data['publish_time'] or 'Unknown')
+                logger.info("  - Content blocks: %d", len(article_data['content']))
                 
-                formatted_article = self._format_article(article_data)
+                formatted_article = self._format_article(article_data, now_iso)
+                self._relax_backoff()
                 
-                # 关闭前随机停留一下，模拟真人
-                time.sleep(random.uniform(1, 3))
-                new_page.close()
-                
-                # 关闭后随机等待
-                self._random_delay(2, 4)
+                # 离开前随机停留一下，模拟真人；顺序模式下再多等一会
+                if self.stealth:
+                    await asyncio.sleep(random.uniform(1, 3))
+                    if self.max_concurrency == 1:
+                        await self._random_delay(2, 4)
                 
                 return formatted_article
                 
             except Exception as e:
-                logger.error(f"Crawl attempt {attempt + 1} failed: {title}")
-                logger.error(f"  Error: {e}")
+                logger.error("Crawl attempt %d failed: %s", attempt + 1, title)
+                logger.error("  Error: %s", e)
                 
                 if attempt < max_retries - 1:
-                    self._random_delay(2, 3)
+                    await self._retry_delay()
                     continue
                 else:
                     return None
         
         return None
     
-    def _click_next_page(self) -> bool:
-        """Click next page button"""
+    async def _goto_page(self, n: int, page: Optional[Page] = None) -> bool:
+        """Open list page n directly by URL (on the list page, or the given one)"""
+        page = page or self.page
+        url = f"{self.base_url}?page={n}"
         try:
-            self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            self._random_delay(1, 2)
+            await page.goto(url, wait_until='domcontentloaded', timeout=60000)
+        except Exception as e:
+            logger.warning("⚠️ Load of %s failed: %s, retrying with commit strategy...", url, e)
+            try:
+                await page.goto(url, wait_until='commit', timeout=60000)
+            except Exception as e2:
+                logger.error("Go to page %d failed: %s", n, e2)
+                return False
+        logger.info("Opened list page %d", n)
+        return True
+    
+    async def _prefetch_list_page(self, n: int) -> Optional[Dict]:
+        """Open and read list page n on the spare page; None if it didn't load"""
+        if not await self._goto_page(n, self.spare_page):
+            return None
+        return await self._get_article_list(self.spare_page)
+    
+    async def _next_page(self) -> bool:
+        """Advance to the next list page"""
+        if USE_URL_PAGING:
+            self._page_num += 1
+            return await self._goto_page(self._page_num)
+        return await self._click_next_page()
+    
+    async def _click_next_page(self) -> bool:
+        """Click next page button, then wait until the list shows the next page"""
+        try:
+            if self.stealth:
+                await self._random_delay(1, 2)
             
-            next_button = self.page.query_selector("a:has-text('下一页'), button:has-text('下一页')")
+            # Built once per run. click() scrolls the button into view only
+            # when it isn't visible, as part of the same call, so there is no
+            # separate scroll-to-bottom first (_get_article_list already
+            # scrolled the list to the end)
+            if self._next_locator is None:
+                self._next_locator = self.page.locator(
+                    "a:has-text('下一页'), button:has-text('下一页')"
+                ).first
             
-            if next_button:
-                next_button.scroll_into_view_if_needed()
-                self._random_delay(0.5, 1)
-                next_button.click()
+            if await self._next_locator.count():
+                if self.stealth:
+                    await self._random_delay(0.5, 1)
+                # The list may be re-rendered in place, so wait for its first
+                # link to change rather than for a navigation
+                first_link = await self.page.evaluate(_FIRST_LIST_LINK_JS)
+                await self._next_locator.click()
                 logger.info("Clicked next page")
-                self._random_delay(3, 5)
+                await self.page.wait_for_load_state('domcontentloaded')
+                try:
+                    await self.page.wait_for_function(
+                        f"(prev) => ({_FIRST_LIST_LINK_JS})() !== prev",
+                        arg=first_link, timeout=15000
+                    )
+                except Exception:
+                    logger.warning("⚠️ List did not change after clicking next, continuing")
                 return True
             else:
                 logger.info("Next page button not found")
                 return False
         except Exception as e:
-            logger.error(f"Click next page failed: {e}")
+            logger.error("Click next page failed: %s", e)
             return False
     
+    async def _crawl_articles(self, article_elements: List[Dict]) -> AsyncIterator[Optional[Dict]]:
+        """Crawl a page's articles concurrently, at most max_concurrency at a time
+        
+        Yields each result (None for failures) as soon as it finishes, so
+        batches fill while the rest of the page is still loading.
+        """
+        sem = asyncio.Semaphore(self.max_concurrency)
+        total = len(article_elements)
+        now_iso = datetime.now().isoformat()  # one timestamp for the whole batch
+        
+        async def _guarded(i: int, article_info: Dict) -> Optional[Dict]:
+            async with sem:
+                logger.info(_RULE)
+                logger.info("[%d/%d] %s", i, total, article_info['title'])
+                logger.info(_RULE)
+                article = await self._crawl_single_article(article_info, now_iso)
+                
+                # Sequential mode keeps the browsing pause between articles;
+                # with concurrency the semaphore already paces requests
+                if self.stealth and self.max_concurrency == 1 and i < total:
+                    wait_time = random.uniform(3, 8)
+                    logger.info("⏱️  Waiting %.1f seconds before next article...", wait_time)
+                    await asyncio.sleep(wait_time)
+                return article
+        
+        tasks = [
+            asyncio.create_task(_guarded(i, info))
+            for i, info in enumerate(article_elements, 1)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The consumer stopped early (error or interrupt); don't leave
+            # article pages loading in the background
+            for task in tasks:
+                task.cancel()
+    
+    async def _flush_batch(self, batch: List[Dict],
+                           batch_callback: Optional[Callable[[List[Dict]], None]]):
+        """Hand a batch to batch_callback, then save it to the data file
+        
+        While the writer runs, the callback is queued on the write pool too, so
+        the crawl doesn't wait for it and it stays ordered with the saves. A
+        failing callback is logged and does not stop the save.
+        """
+        if batch_callback:
+            if self._write_pool is None:
+                self._run_batch_callback(batch_callback, batch)
+            else:
+                await self._submit_write(self._run_batch_callback, batch_callback, batch)
+        await self._save_data(batch)
+    
+    @staticmethod
+    def _run_batch_callback(batch_callback: Callable[[List[Dict]], None], batch: List[Dict]):
+        """Call batch_callback, logging instead of raising on failure"""
+        try:
+            logger.info("[Batch] Processing %d articles", len(batch))
+            batch_callback(batch)
+            logger.info("[Batch] Callback executed successfully")
+        except Exception as e:
+            logger.error("[Batch] Callback failed: %s", e)
+    
     def crawl_all_pages(self,
                        max_pages: Optional[int] = None,
                        batch_callback: Optional[Callable[[List[Dict]], None]] = None,
-                       batch_size: int = 5) -> List[Dict]:
-        """Crawl all pages"""
+                       batch_size: int = 5,
+                       write_pool: Optional[Executor] = None) -> List[Dict]:
+        """Crawl all pages
+        
+        Runs the async crawl on a fresh event loop, so it must be called from
+        a thread without one. File writes go to write_pool (one worker) when
+        given.
+        """
+        return asyncio.run(self._crawl_all_pages(max_pages, batch_callback, batch_size, write_pool))
+    
+    async def _crawl_all_pages(self,
+                               max_pages: Optional[int],
+                               batch_callback: Optional[Callable[[List[Dict]], None]],
+                               batch_size: int,
+                               write_pool: Optional[Executor]) -> List[Dict]:
+        """Crawl all pages (async implementation)"""
         all_articles = []
         batch_articles = []
+        prefetch: Optional["asyncio.Task[Optional[Dict]]"] = None
         
         try:
-            self.setup_browser()
-            logger.info(f"Visiting list page: {self.base_url}")
+            self._start_writer(write_pool)
+            await self.setup_browser()
+            logger.info("Visiting list page: %s", self.base_url)
             
             # Linux 服务器网络可能较慢，使用更宽松的策略
             # 使用 domcontentloaded 而不是 load，更快更稳定
             try:
-                self.page.goto(self.base_url, wait_until='domcontentloaded', timeout=60000)
+                await self.page.goto(self.base_url, wait_until='domcontentloaded', timeout=60000)
                 logger.info("✅ List page loaded (domcontentloaded)")
             except Exception as e:
-                logger.warning(f"⚠️ First load attempt failed: {e}")
+                logger.warning("⚠️ First load attempt failed: %s", e)
                 logger.info("🔄 Retrying with commit strategy...")
                 # 如果失败，尝试更宽松的 commit 策略
-                self.page.goto(self.base_url, wait_until='commit', timeout=60000)
+                await self.page.goto(self.base_url, wait_until='commit', timeout=60000)
                 logger.info("✅ List page loaded (commit)")
             
-            # 额外等待让 JS 执行和动态内容加载
-            logger.info("⏳ Waiting for JavaScript execution...")
-            time.sleep(5)
-            
-            # 首次加载后，模拟真人浏览行为
-            logger.info("🤔 Simulating human browsing behavior...")
-            self._random_delay(3, 6)
-            
-            # 随机移动鼠标（模拟真人）
+            # 等到文章列表出现即可，不再固定等待
+            logger.info("⏳ Waiting for article list...")
             try:
-                self.page.mouse.move(random.randint(100, 500), random.randint(100, 500))
-                time.sleep(random.uniform(0.5, 1.5))
-            except:
-                pass
+                await self.page.wait_for_selector(_ARTICLE_LIST_SELECTOR, state='attached', timeout=10000)
+            except Exception:
+                logger.warning("⚠️ Article list not attached yet, continuing")
+            await self._random_delay(0.5, 1.2)  # 少量抖动，避免固定节奏
+            
+            if self.stealth:
+                # 首次加载后，模拟真人浏览行为
+                logger.info("🤔 Simulating human browsing behavior...")
+                await self._random_delay(3, 6)
+                
+                # 随机移动鼠标（模拟真人）：steps 让 Playwright 一次调用走完整条轨迹，
+                # 事件仍是浏览器输入（isTrusted），不能改用 JS dispatchEvent
+                try:
+                    await self.page.mouse.move(
+                        random.randint(100, 500), random.randint(100, 500),
+                        steps=random.randint(5, 10)
+                    )
+                    await asyncio.sleep(random.uniform(0.5, 1.5))
+                except:
+                    pass
             
             page_count = 1
+            self._page_num = 1
             old_pages = 0
             max_old_pages = 3
             
             while True:
-                logger.info(f"\n{'='*60}")
-                logger.info(f"Crawling page {page_count}")
-                logger.info(f"{'='*60}")
+                logger.info("\n%s", _BANNER)
+                logger.info("Crawling page %d", page_count)
+                logger.info(_BANNER)
                 
-                result = self._get_article_list()
+                if prefetch is not None:
+                    # Already loaded on the spare page while the last page was crawled
+                    result = await prefetch
+                    prefetch = None
+                    if result is not None:
+                        self.page, self.spare_page = self.spare_page, self.page
+                        # That list was filtered before the last page's articles
+                        # were marked crawled; skip any the last page just fetched
+                        result['articles'] = [
+                            info for info in result['articles']
+                            if not self._is_scraped(info['url'], info.get('article_id'))
+                        ]
+                    else:
+                        # The spare page failed; load this page on the list page
+                        result = await self._load_list_page(reload=True)
+                else:
+                    result = await self._load_list_page()
+                if result is None:
+                    logger.error("❌ List page %d did not load, stopping crawl", self._page_num)
+                    break
                 article_elements = result['articles']
                 all_old = result['all_old']
                 
+                # Past the last page, ?page=N just renders an empty list
+                if USE_URL_PAGING and result['item_count'] == 0:
+                    logger.info("No more pages")
+                    break
+                
                 if all_old:
                     old_pages += 1
-                    logger.warning(f"All old articles on this page ({old_pages}/{max_old_pages})")
+                    logger.warning("All old articles on this page (%d/%d)", old_pages, max_old_pages)
                     if old_pages >= max_old_pages:
-                        logger.info(f"Stop: {max_old_pages} consecutive pages with old articles")
+                        logger.info("Stop: %d consecutive pages with old articles", max_old_pages)
                         break
                 else:
                     old_pages = 0
                 
+                # Load the next list page while this page's articles are crawled
+                # (stealth mode keeps the slower one-page-at-a-time browsing)
+                if (self.spare_page is not None and not self.stealth and
+                        not (max_pages and page_count >= max_pages)):
+                    prefetch = asyncio.create_task(self._prefetch_list_page(self._page_num + 1))
+                
                 if len(article_elements) == 0:
                     logger.info("No new articles on this page, continue to next page...")
                 else:
-                    logger.info(f"Start crawling {len(article_elements)} articles\n")
+                    logger.info("Start crawling %d articles\n", len(article_elements))
                     
-                    for i, article_info in enumerate(article_elements, 1):
-                        logger.info(f"{'─'*60}")
-                        logger.info(f"[{i}/{len(article_elements)}] {article_info['title']}")
-                        logger.info(f"{'─'*60}")
-                        
-                        article = self._crawl_single_article(article_info)
+                    async for article in self._crawl_articles(article_elements):
+                        # Skip failures and URLs listed twice on the same page
+                        if not article or self._is_scraped(article['url']):
+                            continue
+                        duplicate_of = self._near_duplicate_of(article)
+                        if duplicate_of is not None:
+                            # Remember the URL so the copy isn't fetched again,
+                            # in this run or after a restart
+                            logger.info("🔁 Skipping near-duplicate: %s (matches %s)",
+                                        article['url'], duplicate_of or 'an earlier article')
+                            self._mark_scraped(article['url'])
+                            await self._save_skipped(article, duplicate_of)
+                            continue
+                        all_articles.append(article)
+                        batch_articles.append(article)
                         
-                        if article:
-                            all_articles.append(article)
-                            batch_articles.append(article)
-                            
-                            # Mark as crawled
-                            self.scraped_urls.add(article['url'])
-                            
-                            if len(batch_articles) >= batch_size:
-                                if batch_callback:
-                                    try:
-                                        logger.info(f"[Batch] Processing {len(batch_articles)} articles")
-                                        batch_callback(batch_articles.copy())
-                                        logger.info("[Batch] Callback executed successfully")
-                                    except Exception as e:
-                                        logger.error(f"[Batch] Callback failed: {e}")
-                                
-                                # Save to file
-                                self._save_data(batch_articles.copy())
-                                batch_articles.clear()
+                        # Mark as crawled
+                        self._mark_scraped(article['url'])
                         
-                        if i < len(article_elements):
-                            # 随机等待时间，模拟真人浏览间隔
-                            wait_time = random.uniform(3, 8)  # 增加间隔时间
-                            logger.info(f"⏱️  Waiting {wait_time:.1f} seconds before next article...")
-                            time.sleep(wait_time)
+                        if len(batch_articles) >= batch_size:
+                            # Hand the list over instead of copying it;
+                            # batch_callback must not mutate it, since the
+                            # same list is then queued for the writer
+                            batch, batch_articles = batch_articles, []
+                            await self._flush_batch(batch, batch_callback)
                     
-                    logger.info(f"\n{'='*60}")
-                    logger.info(f"Page {page_count} completed! Crawled {len(article_elements)} new articles")
-                    logger.info(f"{'='*60}")
+                    logger.info("\n%s", _BANNER)
+                    logger.info("Page %d completed! Crawled %d new articles", page_count, len(article_elements))
+                    logger.info(_BANNER)
                 
                 if max_pages and page_count >= max_pages:
-                    logger.warning(f"⚠️ Reached max pages limit: {max_pages}")
+                    logger.warning("⚠️ Reached max pages limit: %d", max_pages)
                     break
                 
-                logger.info(f"\n📄 Preparing to go to next page...")
-                # 翻页前随机等待更长时间，模拟真人浏览
-                wait_time = random.uniform(5, 10)  # 增加翻页间隔
-                logger.info(f"⏱️  Waiting {wait_time:.1f} seconds before turning page...")
-                time.sleep(wait_time)
+                logger.info("\n📄 Preparing to go to next page...")
+                if self.stealth:
+                    # 翻页前随机等待更长时间，模拟真人浏览
+                    wait_time = random.uniform(5, 10)  # 增加翻页间隔
+                    logger.info("⏱️  Waiting %.1f seconds before turning page...", wait_time)
+                    await asyncio.sleep(wait_time)
                 
-                if not self._click_next_page():
+                if prefetch is not None:
+                    self._page_num += 1
+                elif not await self._next_page():
                     logger.info("No more pages")
                     break
                 
                 page_count += 1
             
-            # Process remaining batch
-            if batch_articles:
-                if batch_callback:
-                    try:
-                        logger.info(f"[Batch] Processing remaining {len(batch_articles)} articles")
-                        batch_callback(batch_articles.copy())
-                        logger.info("[Batch] Last batch processed successfully")
-                    except Exception as e:
-                        logger.error(f"[Batch] Last batch failed: {e}")
-                
-                # Save remaining articles to file
-                self._save_data(batch_articles.copy())
-            
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Crawling completed!")
-            logger.info(f"Total crawled: {len(all_articles)} articles")
-            logger.info(f"{'='*60}")
+            logger.info("\n%s", _BANNER)
+            logger.info("Crawling completed!")
+            logger.info("Total crawled: %d articles", len(all_articles))
+            logger.info(_BANNER)
             
             return all_articles
             
         except KeyboardInterrupt:
-            logger.warning(f"\n⚠️ Crawling interrupted by user!")
-            logger.info(f"💾 Saving {len(batch_articles)} articles before exit...")
-            
-            # Save remaining articles
-            if batch_articles:
-                try:
-                    if batch_callback:
-                        batch_callback(batch_articles.copy())
-                    self._save_data(batch_articles.copy())
-                    logger.info(f"✅ Successfully saved {len(batch_articles)} articles")
-                except Exception as save_error:
-                    logger.error(f"❌ Failed to save articles: {save_error}")
-            
-            logger.info(f"📊 Total crawled before interrupt: {len(all_articles)} articles")
+            logger.warning("\n⚠️ Crawling interrupted by user!")
+            logger.info("📊 Total crawled before interrupt: %d articles", len(all_articles))
             return all_articles
             
         except Exception as e:
-            logger.error(f"❌ Crawling error: {e}")
-            import traceback
-            traceback.print_exc()
-            
-            # Try to save remaining articles even on error
-            if batch_articles:
-                logger.info(f"💾 Attempting to save {len(batch_articles)} articles after error...")
-                try:
-                    if batch_callback:
-                        batch_callback(batch_articles.copy())
-                    self._save_data(batch_articles.copy())
-                    logger.info(f"✅ Successfully saved {len(batch_articles)} articles")
-                except Exception as save_error:
-                    logger.error(f"❌ Failed to save articles: {save_error}")
-            
+            logger.exception("❌ Crawling error: %s", e)
             return all_articles
             
         finally:
-            # Close browser
-            if self.browser:
-                try:
-                    self.browser.close()
-                    logger.info("Browser closed")
-                except:
-                    pass
+            if prefetch is not None:
+                prefetch.cancel()
             
-            if self.playwright:
+            # Save the last partial batch, whether the crawl finished or not
+            if batch_articles:
+                logger.info("💾 Saving remaining %d articles...", len(batch_articles))
                 try:
-                    self.playwright.stop()
-                    logger.info("Playwright stopped")
-                except:
-                    pass
+                    await self._flush_batch(batch_articles, batch_callback)
+                except Exception as save_error:
+                    logger.error("❌ Failed to save articles: %s", save_error)
+            
+            # Wait for pending writes before reporting; the browser is closed
+            # even if that fails (e.g. the write pool was already shut down)
+            try:
+                await self._stop_writer()
+            except Exception as e:
+                logger.error("❌ Failed to finish pending writes: %s", e)
+            finally:
+                await self.close_browser()
             
             # Log final statistics
-            logger.info(f"\n{'='*60}")
-            logger.info(f"📊 Final Statistics:")
-            logger.info(f"  - Total articles crawled this session: {len(all_articles)}")
-            logger.info(f"  - Total URLs in history: {len(self.scraped_urls)}")
-            logger.info(f"  - Data file: {self.data_file}")
-            logger.info(f"{'='*60}")
+            logger.info("\n%s", _BANNER)
+            logger.info("📊 Final Statistics:")
+            logger.info("  - Total articles crawled this session: %d", len(all_articles))
+            logger.info("  - Total URLs in history: %d", self.history_size)
+            logger.info("  - Data file: %s", self.data_file)
+            logger.info(_BANNER)
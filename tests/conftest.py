@@ -0,0 +1,23 @@
+"""Test configuration: make the project modules importable from tests/"""
+import importlib.util
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# services.cto51_crawler imports core.proxy_pool, which is not in this tree;
+# stand in a disabled pool (no proxy, nothing to rotate) when it's missing
+if importlib.util.find_spec("core.proxy_pool") is None:
+    class _DisabledProxyPool:
+        enabled = False
+
+        def get_proxy(self):
+            return None
+
+        def reset_counter(self):
+            pass
+
+    _proxy_module = types.ModuleType("core.proxy_pool")
+    _proxy_module.proxy_pool = _DisabledProxyPool()
+    sys.modules["core.proxy_pool"] = _proxy_module
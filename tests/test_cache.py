@@ -0,0 +1,130 @@
+"""Tests for the copy-on-write news cache"""
+from core.cache import NewsCache, ServiceStatus
+from models.news import NewsArticle
+
+
+def _raw(post_id, date, category="技术文章"):
+    return {
+        "id": f"id{post_id}",
+        "title": f"Article {post_id}",
+        "date": date,
+        "url": f"https://ost.51cto.com/posts/{post_id}",
+        "content": [{"type": "text", "value": f"body {post_id}"}],
+        "category": category,
+        "summary": f"summary {post_id}",
+        "source": "51CTO",
+        "fingerprint": None
+    }
+
+
+def _article(post_id, date, category="技术文章"):
+    raw = _raw(post_id, date, category)
+    del raw["fingerprint"]
+    return NewsArticle.model_validate(raw)
+
+
+def _urls(records):
+    return [record.url.rsplit('/', 1)[1] for record in records]
+
+
+def _assert_indexes_agree(cache):
+    snapshot = cache._snapshot
+    for category, records in snapshot.by_category.items():
+        assert records == tuple(r for r in snapshot.by_date if r.category == category)
+    assert sum(len(records) for records in snapshot.by_category.values()) == len(snapshot.by_date)
+    assert snapshot.by_id == {record.id: record for record in snapshot.by_date}
+
+
+def test_update_cache_orders_newest_first_then_crawl_order():
+    cache = NewsCache()
+    cache.update_cache([
+        _article(1, "2024-05-01"),
+        _article(2, "2024-05-03"),
+        _article(3, "2024-05-01"),
+        _article(4, "2024-05-02"),
+        _article(5, "2024-05-03"),
+    ])
+
+    assert _urls(cache.iter_news()) == ["2", "5", "4", "1", "3"]
+    assert _urls(cache.get_news(page=1, page_size=3).articles) == ["2", "5", "4"]
+    assert _urls(cache.get_news(page=2, page_size=3).articles) == ["1", "3"]
+    _assert_indexes_agree(cache)
+
+
+def test_append_raw_batches_keep_crawl_order_within_a_date():
+    cache = NewsCache()
+    cache.append_raw([_raw(1, "2024-05-01"), _raw(2, "2024-05-02")])
+    cache.append_raw([_raw(3, "2024-05-01"), _raw(4, "2024-05-02", category="其他")])
+    cache.append_raw([_raw(5, "2024-05-02"), _raw(1, "2024-05-01")])  # 1 is a duplicate
+
+    assert _urls(cache.iter_news()) == ["2", "4", "5", "1", "3"]
+    assert _urls(cache.iter_news(category="技术文章")) == ["2", "5", "1", "3"]
+    assert _urls(cache.iter_news(category="其他")) == ["4"]
+    assert cache.get_status()["status"] == ServiceStatus.READY.value
+    _assert_indexes_agree(cache)
+
+
+def test_append_after_update_matches_a_single_update():
+    dates = ["2024-05-01", "2024-05-03", "2024-05-01", "2024-05-02", "2024-05-03"]
+    appended = NewsCache()
+    appended.update_cache([_article(1, dates[0]), _article(2, dates[1])])
+    appended.append_to_cache([_article(3, dates[2]), _article(4, dates[3])])
+    appended.append_to_cache([_article(5, dates[4])])
+
+    updated = NewsCache()
+    updated.update_cache([_article(i + 1, date) for i, date in enumerate(dates)])
+
+    assert _urls(appended.iter_news()) == _urls(updated.iter_news())
+    _assert_indexes_agree(appended)
+
+
+def test_search_walks_newest_first():
+    cache = NewsCache()
+    cache.append_raw([_raw(1, "2024-05-01"), _raw(2, "2024-05-02"), _raw(12, "2024-05-03")])
+
+    assert _urls(cache.iter_news(search="ARTICLE 1")) == ["12", "1"]
+    response = cache.get_news(page=1, page_size=1, search="summary 1")
+    assert _urls(response.articles) == ["12"]
+    assert response.total == 2 and response.has_next
+
+
+def test_response_cache_is_invalidated_by_a_new_version():
+    cache = NewsCache()
+    cache.append_raw([_raw(1, "2024-05-01")])
+    first = cache.get_news(page=1, page_size=10)
+    assert cache.get_news(page=1, page_size=10) is first
+
+    cache.append_raw([_raw(2, "2024-05-02")])
+    second = cache.get_news(page=1, page_size=10)
+    assert second is not first
+    assert _urls(second.articles) == ["2", "1"]
+
+    cache.clear_cache()
+    assert cache.get_news(page=1, page_size=10).total == 0
+
+
+def test_response_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr("core.cache._RESPONSE_CACHE_SIZE", 2)
+    cache = NewsCache()
+    cache.append_raw([_raw(1, "2024-05-01")])
+    first = cache.get_news(page=1, page_size=1)
+    cache.get_news(page=2, page_size=1)
+    cache.get_news(page=3, page_size=1)
+
+    assert len(cache._responses) == 2
+    assert cache.get_news(page=1, page_size=1) is not first
+
+
+def test_malformed_record_is_skipped_and_accepted_on_retry():
+    cache = NewsCache()
+    broken = _raw(2, "2024-05-02")
+    del broken["title"]
+    cache.append_raw([_raw(1, "2024-05-01"), broken, _raw(3, "2024-05-03")])
+
+    assert _urls(cache.iter_news()) == ["3", "1"]
+    assert "https://ost.51cto.com/posts/2" not in cache._seen_urls
+
+    cache.append_raw([_raw(2, "2024-05-02")])
+    assert _urls(cache.iter_news()) == ["3", "2", "1"]
+    assert cache.get_by_id("id2").title == "Article 2"
+    _assert_indexes_agree(cache)
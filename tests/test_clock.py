@@ -0,0 +1,27 @@
+"""Tests for the coarse wall-clock timestamp"""
+import asyncio
+from datetime import datetime, timedelta
+
+from core import clock
+
+
+def test_start_clock_refreshes_before_the_first_tick(monkeypatch):
+    # Pretend the module was imported a while ago
+    stale = (datetime.now() - timedelta(minutes=5)).isoformat()
+    monkeypatch.setattr(clock, "_NOW_ISO", stale)
+
+    async def main():
+        clock.start_clock()
+        try:
+            # No await yet, so the tick task hasn't run
+            return clock.now_iso()
+        finally:
+            clock.stop_clock()
+
+    before = datetime.now().isoformat()
+    assert asyncio.run(main()) >= before
+
+
+def test_now_iso_without_a_clock_reads_the_time():
+    before = datetime.now().isoformat()
+    assert clock.now_iso() >= before
@@ -0,0 +1,183 @@
+"""Tests for the crawler's history and near-duplicate helpers"""
+import asyncio
+
+import orjson
+
+from services.cto51_crawler import (CTO51Crawler, _IdBitmap, _MAX_BITMAP_ID, _SIMHASH_MIN_CHARS,
+                                    _SUMMARY_LENGTH, _content_simhash, _post_id, _summarize)
+
+_TEXT = (
+    "鸿蒙应用开发中，ArkTS 的状态管理决定了界面如何随数据刷新。"
+    "本文从 @State、@Prop、@Link 三个装饰器入手，结合一个待办清单示例，"
+    "说明父子组件之间的数据同步方式，以及在列表渲染时如何避免不必要的重绘。"
+    "最后给出在真机上调试状态变化的几个实用技巧，帮助读者快速定位问题。"
+) * 2
+
+
+def _text_blocks(text):
+    return [{"type": "text", "value": text}]
+
+
+def _crawler(tmp_path, **kwargs):
+    return CTO51Crawler(data_file=str(tmp_path / "articles.jsonl"), **kwargs)
+
+
+def _article(post_id, fingerprint):
+    return {
+        "url": f"https://ost.51cto.com/posts/{post_id}",
+        "fingerprint": None if fingerprint is None else f"{fingerprint:016x}"
+    }
+
+
+class _FakePage:
+    """Answers the extraction evaluate() with a fixed __extractArticle result"""
+
+    def __init__(self, result):
+        self.result = result
+
+    async def evaluate(self, script):
+        # orjson.dumps mirrors JSON.stringify for well-formed strings
+        return orjson.dumps(self.result).decode()
+
+
+def test_summary_keeps_an_emoji_at_the_cut_point():
+    text = "字" * (_SUMMARY_LENGTH - 1) + "🔥" + "尾" * 10
+    summary = _summarize([{"type": "image", "value": "a.png"}, {"type": "text", "value": ""},
+                          {"type": "text", "value": text}])
+
+    assert summary == "字" * (_SUMMARY_LENGTH - 1) + "🔥..."
+    assert orjson.loads(orjson.dumps(summary)) == summary
+    assert _summarize([{"type": "text", "value": "短文"}]) == "短文"
+    assert _summarize([]) == ""
+
+
+def test_extract_article_with_an_emoji_at_the_cut_point(tmp_path):
+    text = "字" * (_SUMMARY_LENGTH - 1) + "🔥" + "尾" * 10
+    blocks = [
+        {"type": "text", "value": text},
+        {"type": "image", "value": "https://example.com/a.png"},
+        {"type": "code", "value": "print(1)", "language": "python"},
+    ]
+    page = _FakePage({"author": "作者", "publish_time": "2024-05-01",
+                      "has_container": True, "blocks": blocks})
+
+    article = asyncio.run(_crawler(tmp_path)._extract_article(page))
+
+    assert article == {
+        "author": "作者",
+        "publish_time": "2024-05-01",
+        "content": blocks,
+        "summary": "字" * (_SUMMARY_LENGTH - 1) + "🔥...",
+    }
+
+
+def test_post_id():
+    assert _post_id("https://ost.51cto.com/posts/33501") == 33501
+    # Trailing whitespace is accepted, as by the list page's regex
+    assert _post_id("https://ost.51cto.com/posts/33501 \n") == 33501
+    assert _post_id("https://ost.51cto.com/posts/abc") is None
+    assert _post_id("https://ost.51cto.com/posts/") is None
+    assert _post_id("https://ost.51cto.com/postlist?page=2") is None
+    # Unicode digits: superscripts make int() raise, full-width ones aren't ids either
+    assert _post_id("https://ost.51cto.com/posts/12\u00b3") is None
+    assert _post_id("https://ost.51cto.com/posts/\uff11\uff12") is None
+
+
+def test_history_keys_match_the_list_page(tmp_path):
+    crawler = _crawler(tmp_path)
+    crawler._mark_scraped("https://ost.51cto.com/posts/33501 ")
+    crawler._mark_scraped("https://ost.51cto.com/posts/12\u00b3")
+
+    # The list page passes the id it parsed itself
+    assert crawler._is_scraped("https://ost.51cto.com/posts/33501 ", 33501)
+    assert crawler._is_scraped("https://ost.51cto.com/posts/33501")
+    assert crawler._is_scraped("https://ost.51cto.com/posts/12\u00b3")
+    assert len(crawler.scraped_ids) == 1 and len(crawler.scraped_urls) == 1
+
+
+def test_id_bitmap():
+    ids = _IdBitmap()
+    for post_id in (0, 7, 8, 33501, _MAX_BITMAP_ID - 1, _MAX_BITMAP_ID, _MAX_BITMAP_ID + 5, 1 << 40):
+        ids.add(post_id)
+    ids.add(33501)
+    ids.add(_MAX_BITMAP_ID)
+
+    assert len(ids) == 8
+    for post_id in (0, 7, 8, 33501, _MAX_BITMAP_ID - 1, _MAX_BITMAP_ID, _MAX_BITMAP_ID + 5, 1 << 40):
+        assert post_id in ids
+    for post_id in (1, 9, 33500, _MAX_BITMAP_ID - 2, _MAX_BITMAP_ID + 1, (1 << 40) + 1):
+        assert post_id not in ids
+    # Ids at and above the limit don't grow the bitmap
+    assert len(ids._bits) == _MAX_BITMAP_ID // 8
+
+
+def test_id_bitmap_growth_stops_at_the_limit():
+    ids = _IdBitmap()
+    ids.add(_MAX_BITMAP_ID // 2 + 8)
+    ids.add(_MAX_BITMAP_ID // 2 + 16)
+
+    assert len(ids._bits) <= _MAX_BITMAP_ID // 8
+    assert _MAX_BITMAP_ID // 2 + 16 in ids and _MAX_BITMAP_ID // 2 + 15 not in ids
+
+
+def test_simhash_skips_short_text():
+    assert len(_TEXT) >= _SIMHASH_MIN_CHARS
+    short = _TEXT[:_SIMHASH_MIN_CHARS - 1]
+    assert _content_simhash(_text_blocks(short)) is None
+    # Only text blocks count towards the length
+    blocks = _text_blocks(short) + [{"type": "code", "value": _TEXT, "language": "ts"}]
+    assert _content_simhash(blocks) is None
+
+
+def test_simhash_of_small_edit_is_close():
+    fingerprint = _content_simhash(_text_blocks(_TEXT))
+    assert fingerprint is not None and 0 <= fingerprint < 1 << 64
+    assert _content_simhash(_text_blocks(_TEXT) + [{"type": "image", "value": "a.png"}]) == fingerprint
+
+    edited = _content_simhash(_text_blocks(_TEXT.replace("待办清单", "购物清单", 1)))
+    assert (fingerprint ^ edited).bit_count() <= 3
+
+    other = _content_simhash(_text_blocks("分布式数据库的分片与副本策略，以及一致性协议的取舍。" * 10))
+    assert (fingerprint ^ other).bit_count() > 3
+
+
+def test_near_duplicate_threshold(tmp_path):
+    crawler = _crawler(tmp_path)
+    base = 0x0123456789ABCDEF
+
+    assert crawler._near_duplicate_of(_article(1, base)) is None
+    # Within 3 bits of post 1: dropped, and not added to the window
+    assert crawler._near_duplicate_of(_article(2, base ^ 0b111)) == _article(1, base)["url"]
+    assert len(crawler.fingerprints) == 1
+    # 4 bits away: kept and remembered
+    assert crawler._near_duplicate_of(_article(3, base ^ 0b1111)) is None
+    assert crawler._near_duplicate_of(_article(4, base ^ 0b1111)) == _article(3, base)["url"]
+
+
+def test_near_duplicate_without_fingerprint(tmp_path):
+    crawler = _crawler(tmp_path)
+
+    assert crawler._near_duplicate_of(_article(1, None)) is None
+    assert crawler._near_duplicate_of(_article(2, None)) is None
+    assert len(crawler.fingerprints) == 0
+
+
+def test_near_duplicate_disabled(tmp_path):
+    crawler = _crawler(tmp_path, near_dup_distance=None)
+
+    assert crawler._near_duplicate_of(_article(1, 42)) is None
+    assert crawler._near_duplicate_of(_article(2, 42)) is None
+    assert len(crawler.fingerprints) == 0
+
+
+def test_skipped_near_duplicate_survives_restart(tmp_path):
+    crawler = _crawler(tmp_path)
+    article = _article(40001, 42)
+    crawler._mark_scraped(article["url"])
+    asyncio.run(crawler._save_skipped(article, "https://ost.51cto.com/posts/40000"))
+
+    restarted = _crawler(tmp_path)
+    assert restarted._is_scraped(article["url"])
+    assert not restarted._is_scraped("https://ost.51cto.com/posts/40000")
+    # The dropped copy's fingerprint doesn't join the near-duplicate window
+    assert len(restarted.fingerprints) == 0
@@ -0,0 +1,142 @@
+"""Tests for the JSON Lines article data file helpers"""
+import orjson
+
+from core.storage import (append_articles, iter_articles, iter_history,
+                          migrate_legacy_json, _scan_history_line)
+
+
+def _article(post_id, fingerprint="00ff00ff00ff00ff", url=None):
+    return {
+        "id": f"id{post_id}",
+        "title": f"文章 {post_id}",
+        "date": "2024-05-01",
+        "url": url or f"https://ost.51cto.com/posts/{post_id}",
+        "content": [{"type": "text", "value": '含 "url":"x" 的正文'}],
+        "category": "技术文章",
+        "summary": "摘要",
+        "source": "51CTO",
+        "created_at": "2024-05-01T00:00:00",
+        "updated_at": "2024-05-01T00:00:00",
+        "fingerprint": fingerprint
+    }
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "data" / "articles.jsonl")
+    first = [_article(1), _article(2)]
+    second = [_article(3)]
+    append_articles(path, first)
+    append_articles(path, second)
+
+    assert list(iter_articles(path)) == first + second
+    assert list(iter_history(path)) == [
+        (article["url"], article["fingerprint"]) for article in first + second
+    ]
+
+
+def test_history_lines_are_sliced_without_parsing(tmp_path):
+    path = str(tmp_path / "articles.jsonl")
+    append_articles(path, [_article(1)])
+    with open(path, 'rb') as f:
+        line = f.read().strip()
+
+    assert _scan_history_line(line) == ("https://ost.51cto.com/posts/1", "00ff00ff00ff00ff")
+
+
+def test_null_fingerprint(tmp_path):
+    path = str(tmp_path / "articles.jsonl")
+    append_articles(path, [_article(1, fingerprint=None), _article(2)])
+
+    assert list(iter_history(path)) == [
+        ("https://ost.51cto.com/posts/1", None),
+        ("https://ost.51cto.com/posts/2", "00ff00ff00ff00ff"),
+    ]
+
+
+def test_escaped_url_falls_back_to_parsing(tmp_path):
+    path = str(tmp_path / "articles.jsonl")
+    url = 'https://ost.51cto.com/posts/a"b\\c'
+    append_articles(path, [_article(1, url=url)])
+    with open(path, 'rb') as f:
+        line = f.read().strip()
+
+    assert _scan_history_line(line) is None
+    assert list(iter_history(path)) == [(url, "00ff00ff00ff00ff")]
+
+
+def test_line_from_other_writer_is_parsed(tmp_path):
+    path = tmp_path / "articles.jsonl"
+    # Pretty-printed with spaces, so the compact keys are not found
+    path.write_text('{"url": "https://ost.51cto.com/posts/7", "fingerprint": null}\n',
+                    encoding='utf-8')
+
+    assert list(iter_history(str(path))) == [("https://ost.51cto.com/posts/7", None)]
+
+
+def test_truncated_last_line(tmp_path):
+    path = str(tmp_path / "articles.jsonl")
+    append_articles(path, [_article(1), _article(2)])
+    # Simulate a crash halfway through writing the second line
+    with open(path, 'rb+') as f:
+        size = f.seek(0, 2)
+        f.truncate(size - 40)
+
+    assert list(iter_history(path)) == [("https://ost.51cto.com/posts/1", "00ff00ff00ff00ff")]
+    assert list(iter_articles(path)) == [_article(1)]
+
+    # The next append terminates the broken line instead of joining it
+    append_articles(path, [_article(3)])
+    assert list(iter_articles(path)) == [_article(1), _article(3)]
+    assert [url for url, _ in iter_history(path)] == [
+        "https://ost.51cto.com/posts/1",
+        "https://ost.51cto.com/posts/3",
+    ]
+
+
+def test_line_cut_after_a_content_block(tmp_path):
+    path = str(tmp_path / "articles.jsonl")
+    append_articles(path, [_article(1)])
+    with open(path, 'rb') as f:
+        line = f.read()
+    # Ends in a '}' but is missing everything after the first content block
+    cut = line[:line.index(b'}]') + 1]
+
+    assert _scan_history_line(cut) is None
+    with open(path, 'wb') as f:
+        f.write(cut)
+    assert list(iter_history(path)) == []
+
+
+def test_migrate_legacy_json(tmp_path):
+    path = tmp_path / "articles.jsonl"
+    legacy_path = tmp_path / "articles.json"
+    articles = [_article(1), _article(2, fingerprint=None)]
+    legacy_path.write_bytes(orjson.dumps(articles, option=orjson.OPT_INDENT_2))
+
+    migrate_legacy_json(str(path))
+
+    assert list(iter_articles(str(path))) == articles
+    assert list(iter_history(str(path))) == [
+        ("https://ost.51cto.com/posts/1", "00ff00ff00ff00ff"),
+        ("https://ost.51cto.com/posts/2", None),
+    ]
+    assert not (tmp_path / "articles.jsonl.tmp").exists()
+
+
+def test_migrate_keeps_existing_jsonl(tmp_path):
+    path = tmp_path / "articles.jsonl"
+    legacy_path = tmp_path / "articles.json"
+    legacy_path.write_bytes(orjson.dumps([_article(1)]))
+    append_articles(str(path), [_article(2)])
+
+    migrate_legacy_json(str(path))
+
+    assert list(iter_articles(str(path))) == [_article(2)]
+
+
+def test_migrate_without_legacy_file(tmp_path):
+    path = tmp_path / "articles.jsonl"
+
+    migrate_legacy_json(str(path))
+
+    assert not path.exists()